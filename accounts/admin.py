@@ -12,13 +12,13 @@ from .models import User, UserProfile
 class UserAdmin(BaseUserAdmin):
     """Custom admin for User model."""
     
-    list_display = [
+    list_display = (
         'email', 'get_full_name', 'role', 'is_active', 
         'is_staff', 'date_joined'
-    ]
-    list_filter = ['role', 'is_active', 'is_staff', 'date_joined']
-    search_fields = ['email', 'first_name', 'last_name', 'phone_number']
-    ordering = ['-date_joined']
+    )
+    list_filter = ('role', 'is_active', 'is_staff', 'date_joined')
+    search_fields = ('email', 'first_name', 'last_name', 'phone_number')
+    ordering = ('-date_joined',)
     
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
@@ -43,33 +43,28 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
     
-    readonly_fields = ['date_joined', 'last_login']
+    readonly_fields = ('date_joined', 'last_login')
     
     def get_full_name(self, obj):
         """Display full name in list view."""
         return obj.get_full_name()
     get_full_name.short_description = 'Full Name'
-    
-    def save_model(self, request, obj, form, change):
-        """Create profile when creating user from admin."""
-        super().save_model(request, obj, form, change)
-        # Ensure profile exists
-        UserProfile.objects.get_or_create(user=obj)
 
 
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     """Admin for UserProfile model."""
     
-    list_display = [
+    list_display = (
         'user', 'date_of_birth', 'emergency_contact_name',
         'created_at', 'updated_at'
-    ]
-    search_fields = [
+    )
+    search_fields = (
         'user__email', 'user__first_name', 'user__last_name',
         'emergency_contact_name'
-    ]
-    list_filter = ['created_at', 'updated_at']
+    )
+    list_filter = ('created_at', 'updated_at')
+    list_select_related = ('user',)
     
     fieldsets = (
         (_('User'), {
@@ -90,4 +85,4 @@ class UserProfileAdmin(admin.ModelAdmin):
         }),
     )
     
-    readonly_fields = ['created_at', 'updated_at']
\ No newline at end of file
+    readonly_fields = ('created_at', 'updated_at')
\ No newline at end of file
@@ -4,6 +4,7 @@ Custom authentication backend for email-based login.
 
 from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 
 User = get_user_model()
 
@@ -24,20 +25,24 @@ class EmailBackend(ModelBackend):
         Returns:
             User object if authentication succeeds, None otherwise
         """
-        try:
-            # Try to fetch user by email
-            user = User.objects.get(email=username.lower())
-            
-            # Check password
-            if user.check_password(password):
-                return user
-            
-        except User.DoesNotExist:
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        
+        # Case-insensitive lookup served by the LOWER(email) index
+        user = User.objects.with_email(username).first()
+        
+        if user is None:
             # Run the default password hasher once to reduce timing
             # difference between existing and non-existing users
-            User().set_password(password)
+            make_password(password)
             return None
         
+        # Check password
+        if user.check_password(password):
+            return user
+        
         return None
     
     def get_user(self, user_id):
@@ -2,50 +2,123 @@
 Context processors to make variables available in all templates.
 """
 
-from notifications.models import Notification
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
 
+from notifications.models import (
+    Notification,
+    UNREAD_COUNT_CACHE_TIMEOUT,
+    unread_count_cache_key,
+)
 
-def notifications_processor(request):
+RECENT_NOTIFICATIONS_LIMIT = 5
+
+EMPTY_NOTIFICATIONS_CONTEXT = {
+    'unread_notifications_count': 0,
+    'recent_notifications': [],
+    'has_more_notifications': False,
+}
+
+EMPTY_USER_ROLE_CONTEXT = {
+    'is_student': False,
+    'is_doctor': False,
+    'is_admin': False,
+    'user_role': None,
+}
+
+
+def _unread_notifications(user):
+    """Return the user's unread notifications queryset."""
+    return Notification.objects.filter(recipient=user, is_read=False)
+
+
+def _recent_unread_notifications(user):
     """
-    Add unread notification count to all templates.
+    Fetch the most recent unread notifications for the user.
+    
+    One row past the display limit is fetched so callers can tell whether
+    more unread notifications exist without a separate COUNT query.
     """
-    if request.user.is_authenticated:
-        unread_count = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).count()
-        
-        recent_notifications = Notification.objects.filter(
-            recipient=request.user,
-            is_read=False
-        ).order_by('-created_at')[:5]
+    return list(
+        _unread_notifications(user).order_by('-created_at')[:RECENT_NOTIFICATIONS_LIMIT + 1]
+    )
+
+
+def _unread_notifications_count(user, unread_window):
+    """
+    Count the user's unread notifications.
+    
+    The COUNT query (cached briefly) is only needed when the fetched window
+    shows there are more unread notifications than the display limit.
+    """
+    if len(unread_window) <= RECENT_NOTIFICATIONS_LIMIT:
+        return len(unread_window)
+    
+    return cache.get_or_set(
+        unread_count_cache_key(user.pk),
+        _unread_notifications(user).count,
+        UNREAD_COUNT_CACHE_TIMEOUT
+    )
+
+
+def build_notifications_context(user):
+    """
+    Build the notification template context for a user.
+    
+    Values are lazy so no query runs unless the rendered template uses them.
+    """
+    if user.is_authenticated:
+        unread_window = SimpleLazyObject(
+            lambda: _recent_unread_notifications(user)
+        )
         
         return {
-            'unread_notifications_count': unread_count,
-            'recent_notifications': recent_notifications,
+            'unread_notifications_count': SimpleLazyObject(
+                lambda: _unread_notifications_count(user, unread_window)
+            ),
+            'recent_notifications': SimpleLazyObject(
+                lambda: unread_window[:RECENT_NOTIFICATIONS_LIMIT]
+            ),
+            'has_more_notifications': SimpleLazyObject(
+                lambda: len(unread_window) > RECENT_NOTIFICATIONS_LIMIT
+            ),
         }
     
-    return {
-        'unread_notifications_count': 0,
-        'recent_notifications': [],
-    }
+    return dict(EMPTY_NOTIFICATIONS_CONTEXT)
+
+
+def build_user_role_context(user):
+    """Build the role template context for a user."""
+    if user.is_authenticated:
+        # Compare the role once here rather than through the User helpers
+        role = user.role
+        return {
+            'is_student': role == 'student',
+            'is_doctor': role == 'doctor',
+            'is_admin': user.is_superuser or role == 'admin',
+            'user_role': role,
+        }
+    
+    return dict(EMPTY_USER_ROLE_CONTEXT)
+
+
+def notifications_processor(request):
+    """
+    Add unread notification count to all templates.
+    Reuses the context memoized by AccountsContextMiddleware when present.
+    """
+    context = getattr(request, '_notifications_context', None)
+    if context is None:
+        context = build_notifications_context(request.user)
+    return context
 
 
 def user_role_processor(request):
     """
     Add user role information to all templates.
+    Reuses the context memoized by AccountsContextMiddleware when present.
     """
-    if request.user.is_authenticated:
-        return {
-            'is_student': request.user.is_student(),
-            'is_doctor': request.user.is_doctor(),
-            'is_admin': request.user.is_admin_user(),
-            'user_role': request.user.role,
-        }
-    
-    return {
-        'is_student': False,
-        'is_doctor': False,
-        'is_admin': False,
-        'user_role': None,
-    }
\ No newline at end of file
+    context = getattr(request, '_user_role_context', None)
+    if context is None:
+        context = build_user_role_context(request.user)
+    return context
\ No newline at end of file
@@ -8,6 +8,13 @@ from django.shortcuts import redirect
 from django.contrib import messages
 from django.urls import reverse
 
+# Where to send a user who lacks permission, keyed by role
+ROLE_DASHBOARD_REDIRECTS = {
+    'student': 'students:dashboard',
+    'doctor': 'doctors:dashboard',
+    'admin': 'home',
+}
+
 
 def role_required(*roles):
     """
@@ -22,6 +29,8 @@ def role_required(*roles):
         def staff_only_view(request):
             ...
     """
+    roles = frozenset(roles)
+    
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(request, *args, **kwargs):
@@ -29,18 +38,14 @@ def role_required(*roles):
                 messages.warning(request, 'Please log in to access this page.')
                 return redirect('accounts:login')
             
-            if request.user.role not in roles and not request.user.is_superuser:
+            role = request.user.role
+            if role not in roles and not request.user.is_superuser:
                 messages.error(
                     request,
                     'You do not have permission to access this page.'
                 )
                 # Redirect based on role
-                if request.user.is_student():
-                    return redirect('students:dashboard')
-                elif request.user.is_doctor():
-                    return redirect('doctors:dashboard')
-                else:
-                    return redirect('home')
+                return redirect(ROLE_DASHBOARD_REDIRECTS.get(role, 'home'))
             
             return view_func(request, *args, **kwargs)
         return _wrapped_view
@@ -165,10 +170,10 @@ class RoleRequiredMixin:
     
     Usage:
         class StudentDashboardView(RoleRequiredMixin, TemplateView):
-            allowed_roles = ['student']
+            allowed_roles = frozenset({'student'})
             template_name = 'student/dashboard.html'
     """
-    allowed_roles = []
+    allowed_roles = frozenset()
     
     def dispatch(self, request, *args, **kwargs):
         if not request.user.is_authenticated:
@@ -196,24 +201,19 @@ class RoleRequiredMixin:
     
     def handle_no_permission(self, request):
         """Redirect user based on their role."""
-        if request.user.is_student():
-            return redirect('students:dashboard')
-        elif request.user.is_doctor():
-            return redirect('doctors:dashboard')
-        else:
-            return redirect('home')
+        return redirect(ROLE_DASHBOARD_REDIRECTS.get(request.user.role, 'home'))
 
 
 class StudentRequiredMixin(RoleRequiredMixin):
     """Mixin to restrict access to students only."""
-    allowed_roles = ['student']
+    allowed_roles = frozenset({'student'})
 
 
 class DoctorRequiredMixin(RoleRequiredMixin):
     """Mixin to restrict access to doctors and admins."""
-    allowed_roles = ['doctor', 'admin']
+    allowed_roles = frozenset({'doctor', 'admin'})
 
 
 class AdminRequiredMixin(RoleRequiredMixin):
     """Mixin to restrict access to admins only."""
-    allowed_roles = ['admin']
\ No newline at end of file
+    allowed_roles = frozenset({'admin'})
\ No newline at end of file
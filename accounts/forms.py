@@ -2,6 +2,9 @@
 Authentication forms for user registration and login.
 """
 
+import re
+import secrets
+
 from django import forms
 from doctors.models import DoctorProfile
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
@@ -9,8 +12,44 @@ from django.core.exceptions import ValidationError
 from django.conf import settings
 from .models import User, UserProfile
 
+# Random bytes behind auto-generated temporary passwords (12 URL-safe chars)
+TEMP_PASSWORD_BYTES = 9
+
+
+def generate_temp_password():
+    """Return a random temporary password from the OS CSPRNG."""
+    return secrets.token_urlsafe(TEMP_PASSWORD_BYTES)
+
+
+# Phone number cleanup: strip spaces/dashes, then allow an optional leading +
+PHONE_STRIP_TABLE = str.maketrans('', '', ' -')
+PHONE_NUMBER_RE = re.compile(r'\+?\d+')
+
+# Institutional email suffix, resolved once from settings
+INSTITUTIONAL_EMAIL_DOMAIN = settings.INSTITUTIONAL_EMAIL_DOMAIN
+INSTITUTIONAL_EMAIL_SUFFIX = f'@{INSTITUTIONAL_EMAIL_DOMAIN.lower()}'
+
 
-class UserRegistrationForm(UserCreationForm):
+class EmailCheckedInCleanMixin:
+    """
+    Skip the model-level unique check on email.
+    
+    clean_email already runs a case-insensitive existence query, so the
+    ModelForm's own unique validation would repeat the same lookup on
+    every submit.
+    """
+    
+    def validate_unique(self):
+        """Run the model's unique checks except the one on email."""
+        exclude = self._get_validation_exclusions()
+        exclude.add('email')
+        try:
+            self.instance.validate_unique(exclude=exclude)
+        except ValidationError as e:
+            self._update_errors(e)
+
+
+class UserRegistrationForm(EmailCheckedInCleanMixin, UserCreationForm):
     """
     Custom registration form with institutional email validation.
     Only allows @tip.edu.ph email addresses.
@@ -100,33 +139,33 @@ class UserRegistrationForm(UserCreationForm):
     
     def clean_email(self):
         """Validate that email is from institutional domain."""
-        email = self.cleaned_data.get('email')
+        # Normalize once; emails are stored lower-cased
+        email = (self.cleaned_data.get('email') or '').strip().lower()
         
         if not email:
             raise ValidationError('Email is required.')
         
         # Check institutional domain
-        institutional_domain = settings.INSTITUTIONAL_EMAIL_DOMAIN
-        if not email.endswith(f'@{institutional_domain}'):
+        if not email.endswith(INSTITUTIONAL_EMAIL_SUFFIX):
             raise ValidationError(
-                f'Only {institutional_domain} email addresses are allowed. '
+                f'Only {INSTITUTIONAL_EMAIL_DOMAIN} email addresses are allowed. '
                 f'Please use your institutional email.'
             )
         
         # Check if email already exists
-        if User.objects.filter(email=email).exists():
+        if User.objects.with_email(email).exists():
             raise ValidationError('This email address is already registered.')
         
-        return email.lower()
+        return email
     
     def clean_phone_number(self):
         """Validate phone number format."""
         phone = self.cleaned_data.get('phone_number')
         if phone:
             # Remove spaces and dashes
-            phone = phone.replace(' ', '').replace('-', '')
+            phone = phone.translate(PHONE_STRIP_TABLE)
             # Basic validation
-            if not phone.startswith('+') and not phone.isdigit():
+            if not PHONE_NUMBER_RE.fullmatch(phone):
                 raise ValidationError('Invalid phone number format.')
         return phone
     
@@ -141,9 +180,8 @@ class UserRegistrationForm(UserCreationForm):
         user.role = 'student'  # Force student role
         
         if commit:
+            # UserProfile is created by the post_save signal
             user.save()
-            # Use get_or_create to avoid duplicate profile creation
-            UserProfile.objects.get_or_create(user=user)
         
         return user
 
@@ -297,12 +335,12 @@ class PasswordResetRequestForm(forms.Form):
     
     def clean_email(self):
         """Validate email exists in system."""
-        email = self.cleaned_data.get('email')
-        if not User.objects.filter(email=email).exists():
+        email = (self.cleaned_data.get('email') or '').strip().lower()
+        if not User.objects.with_email(email).exists():
             raise ValidationError('No account found with this email address.')
-        return email.lower()
+        return email
 
-class DoctorRegistrationForm(forms.ModelForm):
+class DoctorRegistrationForm(EmailCheckedInCleanMixin, forms.ModelForm):
     """
     Form for admin to add new Doctor accounts.
     Admin-only functionality - auto-generates secure password.
@@ -351,47 +389,39 @@ class DoctorRegistrationForm(forms.ModelForm):
     
     def clean_email(self):
         """Validate that email is from institutional domain."""
-        email = self.cleaned_data.get('email')
+        # Normalize once; emails are stored lower-cased
+        email = (self.cleaned_data.get('email') or '').strip().lower()
         
         if not email:
             raise ValidationError('Email is required.')
         
         # Check institutional domain
-        institutional_domain = settings.INSTITUTIONAL_EMAIL_DOMAIN
-        if not email.endswith(f'@{institutional_domain}'):
+        if not email.endswith(INSTITUTIONAL_EMAIL_SUFFIX):
             raise ValidationError(
-                f'Only {institutional_domain} email addresses are allowed.'
+                f'Only {INSTITUTIONAL_EMAIL_DOMAIN} email addresses are allowed.'
             )
         
         # Check if email already exists
-        if User.objects.filter(email=email).exists():
+        if User.objects.with_email(email).exists():
             raise ValidationError('This email address is already registered.')
         
-        return email.lower()
+        return email
     
     def save(self, commit=True):
         """Create doctor user with auto-generated password."""
-        import random
-        import string
-        
         user = super().save(commit=False)
         user.email = self.cleaned_data['email'].lower()
         user.role = 'doctor'  # Force doctor role
         
         # Generate secure random password
-        temp_password = ''.join(
-            random.choices(string.ascii_letters + string.digits + '!@#$%', k=12)
-        )
+        temp_password = generate_temp_password()
         user.set_password(temp_password)  # Hash password
         
         if commit:
+            # UserProfile is created by the post_save signal
             user.save()
-            # Create user profile
-            from accounts.models import UserProfile
-            UserProfile.objects.get_or_create(user=user)
             
             # Create doctor profile with temp password
-            from doctors.models import DoctorProfile
             doctor_profile, created = DoctorProfile.objects.get_or_create(
                 user=user,
                 defaults={
@@ -430,7 +460,6 @@ class DoctorProfileForm(forms.ModelForm):
     )
     
     class Meta:
-        from doctors.models import DoctorProfile
         model = DoctorProfile
         fields = ['specialization', 'license_number']
     
@@ -438,11 +467,11 @@ class DoctorProfileForm(forms.ModelForm):
         """Validate license number is unique."""
         license_number = self.cleaned_data.get('license_number')
         
-        # Check if license number already exists (excluding current user)
-        from doctors.models import DoctorProfile
-        existing = DoctorProfile.objects.filter(
-            license_number=license_number
-        ).exclude(user=self.instance.user if self.instance.pk else None)
+        # Check if license number already exists (excluding current user).
+        # The profile pk is the user id, so no User row needs loading.
+        existing = DoctorProfile.objects.filter(license_number=license_number)
+        if self.instance.pk:
+            existing = existing.exclude(pk=self.instance.pk)
         
         if existing.exists():
             raise ValidationError('This license number is already registered.')
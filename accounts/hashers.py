@@ -0,0 +1,21 @@
+"""
+Password hashers for TIP MDS EMR system.
+"""
+
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher with cost parameters taken from settings.
+    
+    Defaults follow the OWASP 46 MiB / t=1 / p=1 profile; adjust
+    ARGON2_TIME_COST, ARGON2_MEMORY_COST (KiB) and ARGON2_PARALLELISM
+    so a hash takes roughly 250ms on the production host. Existing
+    hashes are transparently upgraded on the next successful login.
+    """
+    
+    time_cost = getattr(settings, 'ARGON2_TIME_COST', 1)
+    memory_cost = getattr(settings, 'ARGON2_MEMORY_COST', 47104)
+    parallelism = getattr(settings, 'ARGON2_PARALLELISM', 1)
\ No newline at end of file
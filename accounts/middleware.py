@@ -0,0 +1,53 @@
+"""
+Middleware for accounts app.
+Memoizes the per-user template context once per request.
+"""
+
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+
+from .context_processors import (
+    EMPTY_NOTIFICATIONS_CONTEXT,
+    EMPTY_USER_ROLE_CONTEXT,
+    build_notifications_context,
+    build_user_role_context,
+)
+
+
+def _exempt_path_prefixes():
+    """Paths that never render notification or role UI."""
+    return tuple(
+        prefix for prefix in (settings.STATIC_URL, settings.MEDIA_URL, '/admin/')
+        if prefix
+    )
+
+
+class AccountsContextMiddleware:
+    """
+    Attach notification and role template context to the request.
+    
+    The context processors read these attributes, so the work runs at most
+    once per request no matter how many templates are rendered. Exempt
+    paths (static, media, admin, JSON APIs) get the empty defaults.
+    Must be placed after AuthenticationMiddleware.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.exempt_prefixes = _exempt_path_prefixes()
+    
+    def __call__(self, request):
+        path = request.path_info
+        if path.startswith(self.exempt_prefixes) or '/api/' in path:
+            request._notifications_context = EMPTY_NOTIFICATIONS_CONTEXT
+            request._user_role_context = EMPTY_USER_ROLE_CONTEXT
+        else:
+            user = request.user
+            request._notifications_context = SimpleLazyObject(
+                lambda: build_notifications_context(user)
+            )
+            request._user_role_context = SimpleLazyObject(
+                lambda: build_user_role_context(user)
+            )
+        
+        return self.get_response(request)
\ No newline at end of file
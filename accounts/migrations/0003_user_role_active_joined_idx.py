@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_email_lower_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='accounts_us_role_1fa9a5_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'is_active', '-date_joined'], name='user_role_active_joined_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:19
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_role_active_joined_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='accounts_us_email_74c8d6_idx',
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:19
+
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def populate_email_domain(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    users = []
+    for user in User.objects.only('id', 'email').iterator(chunk_size=BATCH_SIZE):
+        user.email_domain = user.email.rsplit('@', 1)[-1].lower() if '@' in user.email else ''
+        users.append(user)
+        # Write each batch as it fills so memory stays flat
+        if len(users) == BATCH_SIZE:
+            User.objects.bulk_update(users, ['email_domain'])
+            users = []
+    if users:
+        User.objects.bulk_update(users, ['email_domain'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_remove_user_email_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_domain',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255, verbose_name='email domain'),
+        ),
+        migrations.RunPython(populate_email_domain, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_backfill_user_profiles'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='accounts_us_is_acti_a5841d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['is_active'], name='user_inactive_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:21
+
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat, Trim
+
+
+def populate_full_name(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    User.objects.update(
+        full_name=Trim(Concat('first_name', Value(' '), 'last_name'))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_user_inactive_partial_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(blank=True, editable=False, max_length=301, verbose_name='full name'),
+        ),
+        migrations.RunPython(populate_full_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:22
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    lower_email = django.db.models.functions.text.Lower('email')
+    
+    # Lower-casing accounts that differ only by case would violate the
+    # unique email index part-way through; refuse before changing anything
+    duplicates = User.objects.annotate(email_lower=lower_email).values(
+        'email_lower'
+    ).annotate(
+        accounts=models.Count('pk')
+    ).filter(accounts__gt=1).values_list('email_lower', flat=True)
+    conflicting = list(
+        User.objects.annotate(email_lower=lower_email).filter(
+            email_lower__in=list(duplicates)
+        ).order_by('email_lower', 'pk').values_list('pk', 'email')
+    )
+    if conflicting:
+        raise RuntimeError(
+            'Cannot lower-case user emails: these accounts differ only by case. '
+            'Merge or rename them, then run this migration again:\n'
+            + '\n'.join(f'  user {pk}: {email}' for pk, email in conflicting)
+        )
+    
+    User.objects.exclude(email=lower_email).update(email=lower_email)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0008_user_full_name'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='accounts_user_email_lower_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.CheckConstraint(check=models.Q(('email', django.db.models.functions.text.Lower('email'))), name='user_email_is_lower'),
+        ),
+    ]
@@ -3,12 +3,42 @@ Custom User model for TIP MDS EMR system.
 Uses email as the primary authentication field instead of username.
 """
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.core.cache import cache
 from django.db import models
+from django.db.models.functions import Lower
 from django.core.validators import EmailValidator
 from django.utils.translation import gettext_lazy as _
 
 
+# check_email_api answers are cached briefly per email address
+EMAIL_EXISTS_CACHE_TIMEOUT = 30
+
+
+def email_exists_cache_key(email):
+    """Return the cache key holding whether an email is registered."""
+    return f'email_exists:{email.lower()}'
+
+
+def invalidate_email_exists(email):
+    """Drop the cached registration status for an email address."""
+    if email:
+        cache.delete(email_exists_cache_key(email))
+
+
+def split_email_domain(email):
+    """Return the lower-cased domain part of an email address."""
+    if not email or '@' not in email:
+        return ''
+    return email.rsplit('@', 1)[1].lower()
+
+
+def build_full_name(first_name, last_name):
+    """Return first and last name joined by a space."""
+    return f"{first_name} {last_name}".strip()
+
+
 class UserManager(BaseUserManager):
     """Custom user manager for email-based authentication."""
     
@@ -17,7 +47,8 @@ class UserManager(BaseUserManager):
         if not email:
             raise ValueError(_('The Email field must be set'))
         
-        email = self.normalize_email(email)
+        # Store the canonical lower-cased form so lookups can use plain equality
+        email = self.normalize_email(email).lower()
         user = self.model(email=email, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
@@ -36,6 +67,14 @@ class UserManager(BaseUserManager):
             raise ValueError(_('Superuser must have is_superuser=True.'))
         
         return self.create_user(email, password, **extra_fields)
+    
+    def with_email(self, email):
+        """
+        Return users matching the email case-insensitively.
+        Stored emails are always lower-case (see user_email_is_lower), so a
+        plain equality lookup on the unique email index is enough.
+        """
+        return self.filter(email=email.lower())
 
 
 class User(AbstractUser):
@@ -65,6 +104,15 @@ class User(AbstractUser):
         help_text=_('Required. Must be a valid @tip.edu.ph email address.')
     )
     
+    # Domain part of the email, kept in sync on save for indexed domain filters
+    email_domain = models.CharField(
+        _('email domain'),
+        max_length=255,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )
+    
     # Role field for access control
     role = models.CharField(
         max_length=10,
@@ -77,6 +125,14 @@ class User(AbstractUser):
     first_name = models.CharField(_('first name'), max_length=150)
     last_name = models.CharField(_('last name'), max_length=150)
     
+    # "first last", kept in sync on save so list pages don't rebuild it per row
+    full_name = models.CharField(
+        _('full name'),
+        max_length=301,
+        blank=True,
+        editable=False,
+    )
+    
     phone_number = models.CharField(
         max_length=20,
         blank=True,
@@ -107,18 +163,50 @@ class User(AbstractUser):
         verbose_name_plural = _('users')
         ordering = ['-date_joined']
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['role']),
-            models.Index(fields=['is_active']),
+            # Deactivated users are rare; a partial index keeps this tiny
+            models.Index(
+                fields=['is_active'],
+                name='user_inactive_partial_idx',
+                condition=models.Q(is_active=False)
+            ),
+            # User management list: filter by role, newest first
+            models.Index(
+                fields=['role', 'is_active', '-date_joined'],
+                name='user_role_active_joined_idx'
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(email=Lower('email')),
+                name='user_email_is_lower'
+            ),
         ]
     
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
     
+    def save(self, *args, **kwargs):
+        """Lower-case the email and keep the denormalized columns in sync."""
+        update_fields = kwargs.get('update_fields')
+        derived_fields = set()
+        
+        if update_fields is None or 'email' in update_fields:
+            self.email = self.email.lower()
+            self.email_domain = split_email_domain(self.email)
+            derived_fields.add('email_domain')
+        
+        if update_fields is None or {'first_name', 'last_name'} & set(update_fields):
+            self.full_name = build_full_name(self.first_name, self.last_name)
+            derived_fields.add('full_name')
+        
+        if update_fields is not None and derived_fields:
+            kwargs['update_fields'] = {*update_fields, *derived_fields}
+        
+        super().save(*args, **kwargs)
+    
     def get_full_name(self):
         """Return the first_name plus the last_name, with a space in between."""
-        full_name = f"{self.first_name} {self.last_name}"
-        return full_name.strip()
+        return self.full_name or build_full_name(self.first_name, self.last_name)
     
     def get_short_name(self):
         """Return the short name for the user."""
@@ -135,13 +223,11 @@ class User(AbstractUser):
     
     def is_admin_user(self):
         """Check if user is an administrator."""
-        return self.role == 'admin' or self.is_superuser
+        return self.is_superuser or self.role == 'admin'
     
     def has_institutional_email(self):
         """Check if user has valid institutional email."""
-        from django.conf import settings
-        domain = settings.INSTITUTIONAL_EMAIL_DOMAIN
-        return self.email.endswith(f'@{domain}')
+        return self.email_domain == settings.INSTITUTIONAL_EMAIL_DOMAIN.lower()
     
     def can_approve_requests(self):
         """Check if user can approve student requests."""
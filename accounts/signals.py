@@ -3,20 +3,24 @@ Signals for accounts app.
 Automatically creates UserProfile when User is created.
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-from .models import User, UserProfile
+from .models import User, UserProfile, invalidate_email_exists
 
 
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
-    """Create UserProfile when User is created."""
-    if created:
-        UserProfile.objects.get_or_create(user=instance)
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
+    """
+    Create UserProfile when User is created.
+    This is the single place profiles are created; callers saving a new
+    user should not create one themselves.
+    """
+    if created and not raw:
+        UserProfile.objects.create(user=instance)
 
 
 @receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save UserProfile when User is saved."""
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
\ No newline at end of file
+@receiver(post_delete, sender=User)
+def clear_email_exists_cache(sender, instance, **kwargs):
+    """Invalidate the cached check_email_api answer for this user's email."""
+    invalidate_email_exists(instance.email)
\ No newline at end of file
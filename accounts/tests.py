@@ -1,3 +1,178 @@
+from importlib import import_module
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth.tokens import default_token_generator
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .models import User
+from .views import USER_MANAGEMENT_PAGE_SIZE
+
+
+class LoginViewRedirectTests(TestCase):
+    """Signed-in users are bounced off the login page; stale sessions are not."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            'student@tip.edu.ph', 'pw12345678',
+            first_name='Juan', last_name='Cruz', role='student'
+        )
+        self.client.force_login(self.user)
+    
+    def test_signed_in_user_is_redirected_to_dashboard(self):
+        response = self.client.get(reverse('accounts:login'))
+        
+        self.assertRedirects(
+            response, reverse('students:dashboard'), fetch_redirect_response=False
+        )
+    
+    def test_session_of_deleted_user_shows_login_page(self):
+        self.user.delete()
+        
+        response = self.client.get(reverse('accounts:login'))
+        
+        self.assertEqual(response.status_code, 200)
+    
+    def test_session_invalidated_by_password_change_shows_login_page(self):
+        self.user.set_password('new-password-123')
+        self.user.save()
+        
+        response = self.client.get(reverse('accounts:login'))
+        
+        self.assertEqual(response.status_code, 200)
+
+
+class LastLoginTests(TestCase):
+    """Logging in records last_login straight away."""
+    
+    def test_login_invalidates_earlier_password_reset_token(self):
+        user = User.objects.create_user(
+            'student@tip.edu.ph', 'pw12345678', role='student'
+        )
+        token = default_token_generator.make_token(user)
+        
+        self.client.login(email='student@tip.edu.ph', password='pw12345678')
+        
+        user.refresh_from_db()
+        self.assertIsNotNone(user.last_login)
+        self.assertFalse(default_token_generator.check_token(user, token))
+
+
+class UserManagementViewTests(TestCase):
+    """The user management list renders one page at a time."""
+    
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            'admin@tip.edu.ph', 'pw12345678',
+            first_name='Ana', last_name='Reyes', role='admin'
+        )
+        self.client.force_login(self.admin)
+    
+    def test_list_is_paginated(self):
+        for number in range(USER_MANAGEMENT_PAGE_SIZE):
+            User.objects.create_user(
+                f'student{number}@tip.edu.ph', 'pw12345678', role='student'
+            )
+        
+        response = self.client.get(reverse('accounts:user_management'))
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context['users']), USER_MANAGEMENT_PAGE_SIZE)
+        self.assertContains(response, 'Page 1 of 2')
+        self.assertContains(response, '?page=2')
+    
+    def test_rows_do_not_load_deferred_fields(self):
+        url = reverse('accounts:user_management')
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as one_row:
+            self.client.get(url)
+        
+        for number in range(5):
+            User.objects.create_user(
+                f'student{number}@tip.edu.ph', 'pw12345678',
+                first_name='Juan', last_name='Cruz', role='student'
+            )
+        
+        with self.assertNumQueries(len(one_row)):
+            self.client.get(url)
+    
+    def test_role_filter_is_kept_across_pages(self):
+        for number in range(USER_MANAGEMENT_PAGE_SIZE + 1):
+            User.objects.create_user(
+                f'student{number}@tip.edu.ph', 'pw12345678', role='student'
+            )
+        
+        response = self.client.get(
+            reverse('accounts:user_management'), {'role': 'student', 'page': 2}
+        )
+        
+        self.assertContains(response, 'Page 2 of 2')
+        self.assertContains(response, '?role=student&amp;page=1')
+
+
+class EmailDomainMigrationTests(TestCase):
+    """The 0005 data migration fills email_domain in batches."""
+    
+    def test_every_batch_is_written(self):
+        migration = import_module('accounts.migrations.0005_user_email_domain')
+        for number in range(5):
+            User.objects.create_user(f'user{number}@TIP.edu.ph', 'pw12345678', role='student')
+        User.objects.update(email_domain='')
+        
+        with mock.patch.object(migration, 'BATCH_SIZE', 2):
+            migration.populate_email_domain(apps, None)
+        
+        self.assertEqual(
+            set(User.objects.values_list('email_domain', flat=True)), {'tip.edu.ph'}
+        )
+
 
-# Create your tests here.
+class LowercaseEmailsMigrationTests(TestCase):
+    """The 0009 data migration lower-cases stored emails before constraining them."""
+    
+    def setUp(self):
+        self.migration = import_module('accounts.migrations.0009_user_email_is_lower')
+        # Recreate the pre-migration schema, which allowed mixed-case emails
+        self.constraint = next(
+            constraint for constraint in User._meta.constraints
+            if constraint.name == 'user_email_is_lower'
+        )
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA ignore_check_constraints = ON')
+        else:
+            with connection.schema_editor() as editor:
+                editor.remove_constraint(User, self.constraint)
+    
+    def tearDown(self):
+        # Elsewhere the dropped constraint is restored by the test rollback
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA ignore_check_constraints = OFF')
+    
+    def create_user_with_email(self, email, placeholder):
+        user = User.objects.create_user(placeholder, 'pw12345678', role='student')
+        User.objects.filter(pk=user.pk).update(email=email)
+        return user
+    
+    def test_mixed_case_emails_are_lowercased(self):
+        user = self.create_user_with_email('Juan.Cruz@TIP.edu.ph', 'a@tip.edu.ph')
+        
+        self.migration.lowercase_emails(apps, None)
+        
+        user.refresh_from_db()
+        self.assertEqual(user.email, 'juan.cruz@tip.edu.ph')
+    
+    def test_case_only_duplicates_abort_before_any_change(self):
+        first = self.create_user_with_email('A@tip.edu.ph', 'a1@tip.edu.ph')
+        self.create_user_with_email('a@tip.edu.ph', 'a2@tip.edu.ph')
+        other = self.create_user_with_email('Other@tip.edu.ph', 'b@tip.edu.ph')
+        
+        with self.assertRaisesMessage(RuntimeError, f'user {first.pk}: A@tip.edu.ph'):
+            self.migration.lowercase_emails(apps, None)
+        
+        other.refresh_from_db()
+        self.assertEqual(other.email, 'Other@tip.edu.ph')
@@ -2,18 +2,35 @@
 Authentication views for user registration, login, and profile management.
 """
 
-from django.shortcuts import render, redirect
-from django.contrib.auth import login, logout, authenticate
-from django.contrib.auth.decorators import login_required
+import json
+
+from django.conf import settings
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth import login, logout, authenticate, update_session_auth_hash
+from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
+from django.core.cache import cache
+from django.core.paginator import Paginator
 from django.views.generic import CreateView, TemplateView
 from django.urls import reverse_lazy
 from django.utils.decorators import method_decorator
-from django.http import JsonResponse
+from django.db.models import BooleanField, Case, Value, When
+from django.http import Http404, HttpResponse
 from django.utils import timezone
 
-from .models import User, UserProfile
-from .forms import UserRegistrationForm, UserLoginForm, UserProfileForm
+from .models import (
+    User,
+    UserProfile,
+    EMAIL_EXISTS_CACHE_TIMEOUT,
+    email_exists_cache_key,
+)
+from .forms import (
+    UserRegistrationForm,
+    UserLoginForm,
+    UserProfileForm,
+    DoctorRegistrationForm,
+    generate_temp_password,
+)
 from .decorators import role_required
 
 
@@ -110,8 +127,12 @@ def profile_view(request):
     
     user = request.user
     
-    # Get or create profile
-    profile, created = UserProfile.objects.get_or_create(user=user)
+    # Profiles are created by the post_save signal; the reverse one-to-one
+    # is a single primary-key lookup
+    try:
+        profile = user.profile
+    except UserProfile.DoesNotExist:
+        profile = UserProfile.objects.create(user=user)
     
     if request.method == 'POST':
         form = UserProfileForm(request.POST, instance=profile, user=user)
@@ -160,10 +181,9 @@ def change_password_view(request):
         
         # Update password
         request.user.set_password(new_password)
-        request.user.save()
+        request.user.save(update_fields=['password'])
         
         # Update session to prevent logout
-        from django.contrib.auth import update_session_auth_hash
         update_session_auth_hash(request, request.user)
         
         messages.success(request, 'Password changed successfully!')
@@ -184,6 +204,25 @@ def redirect_after_login(user):
 
 
 # API Views (for AJAX requests)
+
+# check_email_api has a handful of fixed answers; encode them once
+CHECK_EMAIL_RESPONSES = {
+    'missing': json.dumps({'available': False, 'message': 'Email is required'}).encode(),
+    'bad_domain': json.dumps({
+        'available': False,
+        'message': f'Only {settings.INSTITUTIONAL_EMAIL_DOMAIN} emails are allowed'
+    }).encode(),
+    'taken': json.dumps({'available': False, 'message': 'Email already registered'}).encode(),
+    'available': json.dumps({'available': True, 'message': 'Email available'}).encode(),
+}
+INSTITUTIONAL_EMAIL_SUFFIX = f'@{settings.INSTITUTIONAL_EMAIL_DOMAIN.lower()}'
+
+
+def _check_email_response(key):
+    """Return a fresh JSON response carrying a pre-encoded check_email_api body."""
+    return HttpResponse(CHECK_EMAIL_RESPONSES[key], content_type='application/json')
+
+
 @login_required
 def check_email_api(request):
     """API endpoint to check if email is available."""
@@ -191,36 +230,40 @@ def check_email_api(request):
     email = request.GET.get('email', '').lower()
     
     if not email:
-        return JsonResponse({'available': False, 'message': 'Email is required'})
+        return _check_email_response('missing')
     
     # Check institutional domain
-    from django.conf import settings
-    domain = settings.INSTITUTIONAL_EMAIL_DOMAIN
-    
-    if not email.endswith(f'@{domain}'):
-        return JsonResponse({
-            'available': False,
-            'message': f'Only {domain} emails are allowed'
-        })
-    
-    # Check if email exists
-    exists = User.objects.filter(email=email).exists()
-    
-    return JsonResponse({
-        'available': not exists,
-        'message': 'Email already registered' if exists else 'Email available'
-    })
+    if not email.endswith(INSTITUTIONAL_EMAIL_SUFFIX):
+        return _check_email_response('bad_domain')
+    
+    # Check if email exists; emails are stored lower-cased, so this is a
+    # plain lookup on the unique email index. Answers are cached briefly
+    # since the endpoint is polled as the user types.
+    cache_key = email_exists_cache_key(email)
+    exists = cache.get(cache_key)
+    if exists is None:
+        exists = User.objects.filter(email=email).exists()
+        cache.set(cache_key, exists, EMAIL_EXISTS_CACHE_TIMEOUT)
+    
+    return _check_email_response('taken' if exists else 'available')
 
 
-from django.contrib.auth.decorators import user_passes_test
-from django.shortcuts import get_object_or_404
-from .forms import DoctorRegistrationForm
+USER_MANAGEMENT_PAGE_SIZE = 25
+
+# Columns the user management list renders; password etc. are not loaded
+USER_MANAGEMENT_LIST_FIELDS = (
+    'id', 'email', 'first_name', 'last_name', 'full_name',
+    'role', 'is_active', 'date_joined', 'last_login',
+)
 
 
 # Admin check function
 def is_admin(user):
-    """Check if user is admin."""
-    return user.is_authenticated and user.is_admin_user()
+    """
+    Check if user is admin.
+    Only used beneath @login_required, so the user is always authenticated.
+    """
+    return user.is_admin_user()
 
 
 @login_required
@@ -228,18 +271,25 @@ def is_admin(user):
 def user_management_view(request):
     """
     User management view - Admin only.
-    Shows all users (Admin, Doctor, Student).
+    Shows all users (Admin, Doctor, Student), one page at a time.
     """
     # Get all users ordered by date joined (newest first)
-    all_users = User.objects.all().order_by('-date_joined')
+    all_users = User.objects.only(
+        *USER_MANAGEMENT_LIST_FIELDS
+    ).order_by('-date_joined')
     
     # Optional: Filter by role if requested
     role_filter = request.GET.get('role', None)
     if role_filter and role_filter in ['admin', 'doctor', 'student']:
         all_users = all_users.filter(role=role_filter)
     
+    # Only fetch one page of users per request
+    paginator = Paginator(all_users, USER_MANAGEMENT_PAGE_SIZE)
+    page = paginator.get_page(request.GET.get('page'))
+    
     context = {
-        'users': all_users,
+        'users': page,
+        'page_obj': page,
         'role_filter': role_filter,
         'today': timezone.now()
     }
@@ -299,8 +349,8 @@ def view_user_detail(request, user_id):
     View user details - Admin only.
     Shows user information and admin actions (deactivate, reset password).
     """
-    user_obj = get_object_or_404(User, id=user_id)
-    profile = UserProfile.objects.filter(user=user_obj).first()
+    user_obj = get_object_or_404(User.objects.select_related('profile'), id=user_id)
+    profile = getattr(user_obj, 'profile', None)
     
     context = {
         'user_obj': user_obj,
@@ -322,22 +372,27 @@ def deactivate_user(request, user_id):
         messages.error(request, 'Invalid request method.')
         return redirect('doctors:settings')
     
-    user_obj = get_object_or_404(User, id=user_id)
-    
     # Prevent admin from deactivating themselves
-    if user_obj.id == request.user.id:
+    if user_id == request.user.id:
         messages.error(request, 'You cannot deactivate your own account.')
         return redirect('doctors:settings')
     
-    # Toggle active status
-    if user_obj.is_active:
-        user_obj.is_active = False
-        action = 'deactivated'
-    else:
-        user_obj.is_active = True
-        action = 'activated'
+    # Toggle active status in a single atomic UPDATE
+    updated = User.objects.filter(id=user_id).update(
+        is_active=Case(
+            When(is_active=True, then=Value(False)),
+            default=Value(True),
+            output_field=BooleanField(),
+        )
+    )
+    if not updated:
+        raise Http404('No User matches the given query.')
     
-    user_obj.save()
+    # get_full_name() falls back to the name parts when full_name is blank
+    user_obj = User.objects.only(
+        'full_name', 'first_name', 'last_name', 'is_active'
+    ).get(id=user_id)
+    action = 'activated' if user_obj.is_active else 'deactivated'
     
     messages.success(
         request,
@@ -368,16 +423,12 @@ def reset_user_password(request, user_id):
         )
         return redirect('doctors:settings')
     
-    # Generate temporary password (8 random characters)
-    import random
-    import string
-    temp_password = ''.join(
-        random.choices(string.ascii_letters + string.digits, k=12)
-    )
+    # Generate temporary password (12 random URL-safe characters)
+    temp_password = generate_temp_password()
     
     # Set new password (hashed)
     user_obj.set_password(temp_password)
-    user_obj.save()
+    user_obj.save(update_fields=['password'])
     
     messages.success(
         request,
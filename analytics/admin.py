@@ -80,11 +80,11 @@ class GeneratedReportAdmin(admin.ModelAdmin):
     """Admin for GeneratedReport model."""
     
     list_display = [
-        'report_name', 'report_type', 'format',
+        'report_name', 'report_type', 'format', 'status',
         'date_from', 'date_to', 'generated_by',
         'download_count', 'generated_at', 'download_link'
     ]
-    list_filter = ['report_type', 'format', 'generated_at']
+    list_filter = ['report_type', 'format', 'status', 'generated_at']
     search_fields = ['report_name', 'generated_by__email']
     readonly_fields = ['id', 'generated_at', 'download_count', 'download_link']
     date_hierarchy = 'generated_at'
@@ -97,7 +97,7 @@ class GeneratedReportAdmin(admin.ModelAdmin):
             'fields': ('date_from', 'date_to')
         }),
         ('Report File', {
-            'fields': ('report_file', 'download_link')
+            'fields': ('report_file', 'status', 'download_link')
         }),
         ('Filters', {
             'fields': ('filters_applied',)
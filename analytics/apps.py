@@ -8,4 +8,8 @@ from django.apps import AppConfig
 class AnalyticsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'analytics'
-    verbose_name = 'Analytics & Reporting'
\ No newline at end of file
+    verbose_name = 'Analytics & Reporting'
+    
+    def ready(self):
+        """Import signals when app is ready."""
+        import analytics.signals
\ No newline at end of file
@@ -3,11 +3,94 @@ Export functions for generating CSV and PDF reports.
 """
 
 import csv
+import re
+from functools import lru_cache
 from io import StringIO, BytesIO
-from django.http import HttpResponse
-from django.template.loader import render_to_string
-from weasyprint import HTML
+from itertools import islice
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template.loader import get_template
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+import xlsxwriter
 from datetime import datetime
+from appointments.models import Appointment
+from students.models import StudentProfile
+
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Shared across PDF exports so fonts and report CSS are loaded once per process
+FONT_CONFIG = FontConfiguration()
+
+BASE_CSS = CSS(string="""
+    body { font-family: Arial, sans-serif; margin: 40px; }
+    h1 { color: #333; text-align: center; }
+    .header { text-align: center; margin-bottom: 30px; }
+    table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+    th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+    th { background-color: #667eea; color: white; }
+    .morbidity-table { table-layout: fixed; }
+    .morbidity-table col.rank { width: 10%; }
+    .morbidity-table col.dx { width: 55%; }
+    .morbidity-table col.cases { width: 15%; }
+    .morbidity-table col.pct { width: 20%; }
+    .morbidity-table td.dx { word-wrap: break-word; }
+    .stats-grid { border-collapse: separate; border-spacing: 20px; margin-top: 10px; }
+    .stats-grid td { width: 50%; padding: 0; border-bottom: none; }
+    .stat-box { border: 2px solid #667eea; padding: 20px; border-radius: 8px; }
+    .stat-box h3 { margin-top: 0; color: #667eea; }
+    .stat-number { font-size: 36px; font-weight: bold; color: #333; }
+    .footer { margin-top: 30px; text-align: center; font-size: 12px; color: #666; }
+""", font_config=FONT_CONFIG)
+
+# Front-end asset bundles linked from page templates are never used in print
+BUNDLE_LINK_RE = re.compile(r'<link[^>]+href="[^"]*\.bundle[^"]*"[^>]*>')
+
+# Rows fetched per database round trip when streaming large exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Rows handed to each writerows() call while streaming
+CSV_WRITE_BATCH_SIZE = 256
+
+# Streamed CSV is sent to the client in chunks of roughly this many bytes
+CSV_STREAM_BUFFER_SIZE = 64 * 1024
+
+
+def _csv_chunks(rows):
+    """Serialize rows with writerows() and yield ~CSV_STREAM_BUFFER_SIZE chunks."""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    rows = iter(rows)
+    
+    while True:
+        batch = list(islice(rows, CSV_WRITE_BATCH_SIZE))
+        if batch:
+            writer.writerows(batch)
+            if buffer.tell() < CSV_STREAM_BUFFER_SIZE:
+                continue
+        if buffer.tell():
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        if not batch:
+            return
+
+
+def stream_csv(rows, filename):
+    """
+    Stream CSV rows to the client in chunks of about CSV_STREAM_BUFFER_SIZE bytes.
+    
+    Args:
+        rows: Iterable of row sequences, header first
+        filename: Name of CSV file
+    
+    Returns:
+        StreamingHttpResponse with CSV file
+    """
+    response = StreamingHttpResponse(_csv_chunks(rows), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    
+    return response
 
 
 def export_to_csv(data, filename, headers):
@@ -25,11 +108,9 @@ def export_to_csv(data, filename, headers):
     response = HttpResponse(content_type='text/csv')
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
-    writer = csv.writer(response)
-    writer.writerow(headers)
-    
-    for row in data:
-        writer.writerow([row.get(header, '') for header in headers])
+    writer = csv.DictWriter(response, fieldnames=headers, restval='', extrasaction='ignore')
+    writer.writeheader()
+    writer.writerows(data)
     
     return response
 
@@ -79,101 +160,201 @@ def export_consultation_report_csv(stats, date_from, date_to):
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     writer = csv.writer(response)
-    writer.writerow(['TIP MDS EMR - Consultation Report'])
-    writer.writerow([f'Period: {date_from} to {date_to}'])
-    writer.writerow([])
-    
-    writer.writerow(['Metric', 'Count'])
-    writer.writerow(['Total Consultations', stats.get('total_consultations', 0)])
-    writer.writerow(['Medical Consultations', stats.get('medical_consultations', 0)])
-    writer.writerow(['Dental Consultations', stats.get('dental_consultations', 0)])
-    writer.writerow([])
-    writer.writerow(['Total Appointments', stats.get('total_appointments', 0)])
-    writer.writerow(['Completed Appointments', stats.get('completed_appointments', 0)])
-    writer.writerow(['Cancelled Appointments', stats.get('cancelled_appointments', 0)])
-    writer.writerow(['No-Show Appointments', stats.get('no_show_appointments', 0)])
-    writer.writerow([])
-    writer.writerow(['Certificates Issued', stats.get('certificates_issued', 0)])
-    writer.writerow(['Prescriptions Issued', stats.get('prescriptions_issued', 0)])
-    writer.writerow(['New Students Registered', stats.get('new_students_registered', 0)])
+    writer.writerows([
+        ['TIP MDS EMR - Consultation Report'],
+        [f'Period: {date_from} to {date_to}'],
+        [],
+        ['Metric', 'Count'],
+        ['Total Consultations', stats.get('total_consultations', 0)],
+        ['Medical Consultations', stats.get('medical_consultations', 0)],
+        ['Dental Consultations', stats.get('dental_consultations', 0)],
+        [],
+        ['Total Appointments', stats.get('total_appointments', 0)],
+        ['Completed Appointments', stats.get('completed_appointments', 0)],
+        ['Cancelled Appointments', stats.get('cancelled_appointments', 0)],
+        ['No-Show Appointments', stats.get('no_show_appointments', 0)],
+        [],
+        ['Certificates Issued', stats.get('certificates_issued', 0)],
+        ['Prescriptions Issued', stats.get('prescriptions_issued', 0)],
+        ['New Students Registered', stats.get('new_students_registered', 0)],
+    ])
     
     return response
 
 
-def export_appointments_report_csv(appointments):
+def export_to_xlsx(rows, filename, sheet_name='Report'):
     """
-    Export appointments list to CSV.
+    Export rows to a single-sheet Excel workbook.
     
     Args:
-        appointments: QuerySet of appointments
+        rows: Iterable of row sequences, header first
+        filename: Name of XLSX file
+        sheet_name: Worksheet title
     
     Returns:
-        HttpResponse with CSV
+        HttpResponse with XLSX file
     """
-    filename = f"appointments_report_{datetime.now().strftime('%Y%m%d')}.csv"
+    output = BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'in_memory': True})
+    worksheet = workbook.add_worksheet(sheet_name)
     
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    for row_idx, row in enumerate(rows):
+        worksheet.write_row(row_idx, 0, row)
     
-    writer = csv.writer(response)
-    writer.writerow([
-        'Ticket Number', 'Student ID', 'Student Name',
-        'Service Type', 'Preferred Date', 'Time Slot',
-        'Doctor', 'Status', 'Created At'
-    ])
+    workbook.close()
     
-    for apt in appointments:
-        writer.writerow([
-            apt.ticket_number,
-            apt.student.student_id,
-            apt.student.user.get_full_name(),
-            apt.get_service_type_display(),
-            apt.preferred_date.strftime('%Y-%m-%d'),
-            apt.get_preferred_time_slot_display(),
-            apt.doctor.get_full_name() if apt.doctor else 'Not Assigned',
-            apt.get_status_display(),
-            apt.created_at.strftime('%Y-%m-%d %H:%M')
-        ])
+    response = HttpResponse(output.getvalue(), content_type=XLSX_CONTENT_TYPE)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     return response
 
 
-def export_students_report_csv(students):
+def export_morbidity_report_xlsx(morbidities, date_from, date_to, record_type='medical'):
     """
-    Export student registry to CSV.
+    Export morbidity report to Excel.
     
     Args:
-        students: QuerySet of StudentProfile
+        morbidities: List of morbidity data
+        date_from: Start date
+        date_to: End date
+        record_type: 'medical' or 'dental'
     
     Returns:
-        HttpResponse with CSV
+        HttpResponse with XLSX
     """
-    filename = f"students_report_{datetime.now().strftime('%Y%m%d')}.csv"
+    filename = f"morbidity_report_{record_type}_{date_from}_{date_to}.xlsx"
+    rows = [['Rank', 'Diagnosis', 'Cases', 'Percentage']]
+    rows.extend(
+        [idx, item.get('diagnosis', ''), item.get('count', 0), item.get('percentage', 0)]
+        for idx, item in enumerate(morbidities, 1)
+    )
+    
+    return export_to_xlsx(rows, filename, sheet_name='Morbidities')
+
+
+def export_consultation_report_xlsx(stats, date_from, date_to):
+    """
+    Export consultation statistics to Excel.
     
-    response = HttpResponse(content_type='text/csv')
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    Args:
+        stats: Dictionary with consultation statistics
+        date_from: Start date
+        date_to: End date
     
-    writer = csv.writer(response)
-    writer.writerow([
-        'Student ID', 'Full Name', 'Email', 'Program',
-        'Year Level', 'Contact Number', 'Blood Type',
-        'Registered Date', 'Verified'
-    ])
+    Returns:
+        HttpResponse with XLSX
+    """
+    filename = f"consultation_report_{date_from}_{date_to}.xlsx"
+    rows = [
+        ['Metric', 'Count'],
+        ['Total Consultations', stats.get('total_consultations', 0)],
+        ['Medical Consultations', stats.get('medical_consultations', 0)],
+        ['Dental Consultations', stats.get('dental_consultations', 0)],
+        ['Total Appointments', stats.get('total_appointments', 0)],
+        ['Completed Appointments', stats.get('completed_appointments', 0)],
+        ['Cancelled Appointments', stats.get('cancelled_appointments', 0)],
+        ['No-Show Appointments', stats.get('no_show_appointments', 0)],
+        ['Certificates Issued', stats.get('certificates_issued', 0)],
+        ['Prescriptions Issued', stats.get('prescriptions_issued', 0)],
+        ['New Students Registered', stats.get('new_students_registered', 0)],
+    ]
+    
+    return export_to_xlsx(rows, filename, sheet_name='Consultations')
+
+
+def export_appointments_report_csv(appointments):
+    """
+    Export appointments list to CSV.
     
-    for student in students:
-        writer.writerow([
-            student.student_id,
-            student.user.get_full_name(),
-            student.user.email,
-            student.get_program_display(),
-            student.get_year_level_display(),
-            student.contact_number,
-            student.get_blood_type_display(),
-            student.created_at.strftime('%Y-%m-%d'),
-            'Yes' if student.is_verified else 'No'
-        ])
+    Args:
+        appointments: QuerySet of appointments
     
-    return response
+    Returns:
+        StreamingHttpResponse with CSV
+    """
+    filename = f"appointments_report_{datetime.now().strftime('%Y%m%d')}.csv"
+    appointments = appointments.select_related('student__user', 'doctor').only(
+        'ticket_number', 'service_type', 'preferred_date', 'preferred_time_slot',
+        'status', 'created_at', 'student__student_id',
+        'student__user__full_name', 'student__user__first_name', 'student__user__last_name',
+        'doctor__full_name', 'doctor__first_name', 'doctor__last_name'
+    )
+    
+    # Choice labels looked up once instead of get_*_display() per row
+    service_types = dict(Appointment.SERVICE_TYPE_CHOICES)
+    time_slots = dict(Appointment.TIME_SLOT_CHOICES)
+    statuses = dict(Appointment.STATUS_CHOICES)
+    
+    def rows():
+        yield [
+            'Ticket Number', 'Student ID', 'Student Name',
+            'Service Type', 'Preferred Date', 'Time Slot',
+            'Doctor', 'Status', 'Created At'
+        ]
+        for apt in appointments.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield [
+                apt.ticket_number,
+                apt.student.student_id,
+                apt.student.user.get_full_name(),
+                service_types.get(apt.service_type, apt.service_type),
+                apt.preferred_date.strftime('%Y-%m-%d'),
+                time_slots.get(apt.preferred_time_slot, apt.preferred_time_slot),
+                apt.doctor.get_full_name() if apt.doctor else 'Not Assigned',
+                statuses.get(apt.status, apt.status),
+                apt.created_at.strftime('%Y-%m-%d %H:%M')
+            ]
+    
+    return stream_csv(rows(), filename)
+
+
+def export_students_report_csv(students):
+    """
+    Export student registry to CSV.
+    
+    Args:
+        students: QuerySet of StudentProfile
+    
+    Returns:
+        StreamingHttpResponse with CSV
+    """
+    filename = f"students_report_{datetime.now().strftime('%Y%m%d')}.csv"
+    students = students.select_related('user').only(
+        'student_id', 'program', 'year_level', 'contact_number', 'blood_type',
+        'created_at', 'is_verified',
+        'user__email', 'user__full_name', 'user__first_name', 'user__last_name'
+    )
+    
+    # Choice labels looked up once instead of get_*_display() per row
+    programs = dict(StudentProfile.PROGRAM_CHOICES)
+    year_levels = dict(StudentProfile.YEAR_LEVEL_CHOICES)
+    blood_types = dict(StudentProfile.BLOOD_TYPE_CHOICES)
+    
+    def rows():
+        yield [
+            'Student ID', 'Full Name', 'Email', 'Program',
+            'Year Level', 'Contact Number', 'Blood Type',
+            'Registered Date', 'Verified'
+        ]
+        for student in students.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            yield [
+                student.student_id,
+                student.user.get_full_name(),
+                student.user.email,
+                programs.get(student.program, student.program),
+                year_levels.get(student.year_level, student.year_level),
+                student.contact_number,
+                blood_types.get(student.blood_type, student.blood_type),
+                student.created_at.strftime('%Y-%m-%d'),
+                'Yes' if student.is_verified else 'No'
+            ]
+    
+    return stream_csv(rows(), filename)
+
+
+@lru_cache(maxsize=32)
+def _get_template(template_name):
+    """Resolve a report template once per process."""
+    return get_template(template_name)
 
 
 def export_report_to_pdf(template_name, context, filename):
@@ -189,31 +370,30 @@ def export_report_to_pdf(template_name, context, filename):
         HttpResponse with PDF
     """
     # Render HTML
-    html_string = render_to_string(template_name, context)
+    html_string = _get_template(template_name).render(context)
+    html_string = BUNDLE_LINK_RE.sub('', html_string)
     
-    # Generate PDF
-    html = HTML(string=html_string)
-    pdf = html.write_pdf()
-    
-    # Create response
-    response = HttpResponse(pdf, content_type='application/pdf')
+    # Generate PDF straight into the response body
+    response = HttpResponse(content_type='application/pdf')
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    HTML(string=html_string).write_pdf(response, font_config=FONT_CONFIG)
     
     return response
 
 
-def export_morbidity_report_pdf(morbidities, date_from, date_to, record_type='medical'):
+def render_morbidity_report_pdf(morbidities, date_from, date_to, record_type='medical', target=None):
     """
-    Export morbidity report to PDF.
+    Render morbidity report to PDF bytes.
     
     Args:
         morbidities: List of morbidity data
         date_from: Start date
         date_to: End date
         record_type: 'medical' or 'dental'
+        target: Optional file-like object to write the PDF into
     
     Returns:
-        HttpResponse with PDF
+        Tuple of (filename, PDF bytes or None when written to target)
     """
     context = {
         'title': f'Top Morbidities Report - {record_type.title()}',
@@ -227,85 +407,49 @@ def export_morbidity_report_pdf(morbidities, date_from, date_to, record_type='me
     
     filename = f"morbidity_report_{record_type}_{date_from}_{date_to}.pdf"
     
-    # Use inline HTML if template doesn't exist
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; }}
-            h1 {{ color: #333; text-align: center; }}
-            .header {{ text-align: center; margin-bottom: 30px; }}
-            table {{ width: 100%; border-collapse: collapse; margin-top: 20px; }}
-            th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-            th {{ background-color: #667eea; color: white; }}
-            .footer {{ margin-top: 30px; text-align: center; font-size: 12px; color: #666; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>TIP MDS EMR</h1>
-            <h2>{context['title']}</h2>
-            <p>Period: {context['date_from']} to {context['date_to']}</p>
-            <p>Generated: {context['generated_date']}</p>
-        </div>
-        
-        <table>
-            <thead>
-                <tr>
-                    <th>Rank</th>
-                    <th>Diagnosis</th>
-                    <th>Cases</th>
-                    <th>Percentage</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
-    
-    for idx, item in enumerate(morbidities, 1):
-        html_content += f"""
-                <tr>
-                    <td>{idx}</td>
-                    <td>{item.get('diagnosis', '')}</td>
-                    <td>{item.get('count', 0)}</td>
-                    <td>{item.get('percentage', 0)}%</td>
-                </tr>
-        """
-    
-    html_content += f"""
-            </tbody>
-        </table>
-        
-        <div class="footer">
-            <p>Total Cases: {context['total_cases']}</p>
-            <p>Technological Institute of the Philippines - Medical-Dental Services</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_content = _get_template('reports/morbidity_pdf.html').render(context)
     
     # Generate PDF
     html = HTML(string=html_content)
-    pdf = html.write_pdf()
+    pdf = html.write_pdf(target, stylesheets=[BASE_CSS], font_config=FONT_CONFIG)
+    
+    return filename, pdf
+
+
+def export_morbidity_report_pdf(morbidities, date_from, date_to, record_type='medical'):
+    """
+    Export morbidity report to PDF.
+    
+    Args:
+        morbidities: List of morbidity data
+        date_from: Start date
+        date_to: End date
+        record_type: 'medical' or 'dental'
     
-    response = HttpResponse(pdf, content_type='application/pdf')
+    Returns:
+        HttpResponse with PDF
+    """
+    response = HttpResponse(content_type='application/pdf')
+    filename, _ = render_morbidity_report_pdf(
+        morbidities, date_from, date_to, record_type, target=response
+    )
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     return response
 
 
-def export_consultation_report_pdf(stats, date_from, date_to):
+def render_consultation_report_pdf(stats, date_from, date_to, target=None):
     """
-    Export consultation statistics to PDF.
+    Render consultation statistics to PDF bytes.
     
     Args:
         stats: Dictionary with consultation statistics
         date_from: Start date
         date_to: End date
+        target: Optional file-like object to write the PDF into
     
     Returns:
-        HttpResponse with PDF
+        Tuple of (filename, PDF bytes or None when written to target)
     """
     context = {
         'title': 'Consultation Statistics Report',
@@ -317,76 +461,28 @@ def export_consultation_report_pdf(stats, date_from, date_to):
     
     filename = f"consultation_report_{date_from}_{date_to}.pdf"
     
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; }}
-            h1 {{ color: #333; text-align: center; }}
-            .header {{ text-align: center; margin-bottom: 30px; }}
-            .stats-grid {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-top: 30px; }}
-            .stat-box {{ border: 2px solid #667eea; padding: 20px; border-radius: 8px; }}
-            .stat-box h3 {{ margin-top: 0; color: #667eea; }}
-            .stat-number {{ font-size: 36px; font-weight: bold; color: #333; }}
-            .footer {{ margin-top: 30px; text-align: center; font-size: 12px; color: #666; }}
-        </style>
-    </head>
-    <body>
-        <div class="header">
-            <h1>TIP MDS EMR</h1>
-            <h2>{context['title']}</h2>
-            <p>Period: {context['date_from']} to {context['date_to']}</p>
-            <p>Generated: {context['generated_date']}</p>
-        </div>
-        
-        <div class="stats-grid">
-            <div class="stat-box">
-                <h3>Total Consultations</h3>
-                <div class="stat-number">{stats.get('total_consultations', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>Medical Consultations</h3>
-                <div class="stat-number">{stats.get('medical_consultations', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>Dental Consultations</h3>
-                <div class="stat-number">{stats.get('dental_consultations', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>Total Appointments</h3>
-                <div class="stat-number">{stats.get('total_appointments', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>Completed Appointments</h3>
-                <div class="stat-number">{stats.get('completed_appointments', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>Certificates Issued</h3>
-                <div class="stat-number">{stats.get('certificates_issued', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>Prescriptions Issued</h3>
-                <div class="stat-number">{stats.get('prescriptions_issued', 0)}</div>
-            </div>
-            <div class="stat-box">
-                <h3>New Students</h3>
-                <div class="stat-number">{stats.get('new_students_registered', 0)}</div>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>Technological Institute of the Philippines - Medical-Dental Services</p>
-        </div>
-    </body>
-    </html>
-    """
+    html_content = _get_template('reports/consultation_pdf.html').render(context)
     
     html = HTML(string=html_content)
-    pdf = html.write_pdf()
+    pdf = html.write_pdf(target, stylesheets=[BASE_CSS], font_config=FONT_CONFIG)
+    
+    return filename, pdf
+
+
+def export_consultation_report_pdf(stats, date_from, date_to):
+    """
+    Export consultation statistics to PDF.
     
-    response = HttpResponse(pdf, content_type='application/pdf')
+    Args:
+        stats: Dictionary with consultation statistics
+        date_from: Start date
+        date_to: End date
+    
+    Returns:
+        HttpResponse with PDF
+    """
+    response = HttpResponse(content_type='application/pdf')
+    filename, _ = render_consultation_report_pdf(stats, date_from, date_to, target=response)
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     
     return response
\ No newline at end of file
@@ -6,7 +6,13 @@ Can be run manually or via cron job.
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
-from analytics.services import generate_morbidity_statistics, generate_consultation_statistics
+from analytics.services import (
+    generate_morbidity_statistics,
+    generate_consultation_statistics,
+    count_approved_records,
+    iter_period_starts,
+    resolve_period
+)
 
 
 class Command(BaseCommand):
@@ -26,6 +32,13 @@ class Command(BaseCommand):
             type=str,
             help='Start date (YYYY-MM-DD format). Defaults to current period.'
         )
+        
+        parser.add_argument(
+            '--periods',
+            type=int,
+            default=1,
+            help='Number of periods to generate, ending with the start date (for backfills)'
+        )
     
     def handle(self, *args, **options):
         period_type = options['period']
@@ -45,26 +58,35 @@ class Command(BaseCommand):
             else:  # yearly
                 period_start = today.replace(month=1, day=1)
         
-        self.stdout.write(f'Generating {period_type} statistics starting from {period_start}...')
-        
-        # Generate morbidity statistics
-        self.stdout.write('Generating morbidity statistics...')
-        morbidity_stats = generate_morbidity_statistics(
-            period_type=period_type,
-            period_start=period_start
-        )
-        self.stdout.write(
-            self.style.SUCCESS(f'✓ Created {len(morbidity_stats)} morbidity statistics')
-        )
-        
-        # Generate consultation statistics
-        self.stdout.write('Generating consultation statistics...')
-        consultation_stat = generate_consultation_statistics(
-            period_type=period_type,
-            period_start=period_start
-        )
-        self.stdout.write(
-            self.style.SUCCESS(f'✓ Created consultation statistic: {consultation_stat}')
-        )
+        for start in iter_period_starts(period_type, period_start, options['periods']):
+            self.stdout.write(f'Generating {period_type} statistics starting from {start}...')
+            
+            # Both generators share one count of the period's approved records
+            start, end = resolve_period(period_type, start)
+            record_counts = count_approved_records(start, end)
+            
+            # Generate morbidity statistics
+            self.stdout.write('Generating morbidity statistics...')
+            morbidity_stats = generate_morbidity_statistics(
+                period_type=period_type,
+                period_start=start,
+                period_end=end,
+                record_counts=record_counts
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Saved {len(morbidity_stats)} morbidity statistics')
+            )
+            
+            # Generate consultation statistics
+            self.stdout.write('Generating consultation statistics...')
+            consultation_stat = generate_consultation_statistics(
+                period_type=period_type,
+                period_start=start,
+                period_end=end,
+                record_counts=record_counts
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f'✓ Created consultation statistic: {consultation_stat}')
+            )
         
         self.stdout.write(self.style.SUCCESS('✅ Statistics generation completed!'))
\ No newline at end of file
@@ -0,0 +1,54 @@
+"""
+Management command to render queued PDF reports.
+Can be run manually or via cron job to pick up reports whose background
+rendering was interrupted.
+"""
+
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from analytics.models import GeneratedReport
+from analytics.reports import render_report_pdf
+
+
+class Command(BaseCommand):
+    help = 'Render GeneratedReport PDFs that are still pending'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age',
+            type=int,
+            default=5,
+            help='Only render reports queued, or requeue renders started, at least this many minutes ago'
+        )
+    
+    def handle(self, *args, **options):
+        # Younger reports are most likely still being rendered by the web process
+        queued_before = timezone.now() - timedelta(minutes=options['min_age'])
+        
+        # Requeue reports whose render started long ago; the process
+        # rendering them most likely died
+        GeneratedReport.objects.filter(
+            status='rendering',
+            rendering_started_at__lte=queued_before
+        ).update(status='pending')
+        
+        report_ids = list(
+            GeneratedReport.objects.filter(
+                status='pending',
+                generated_at__lte=queued_before
+            ).values_list('id', flat=True)
+        )
+        
+        self.stdout.write(f'Rendering {len(report_ids)} pending report(s)...')
+        
+        for report_id in report_ids:
+            report = render_report_pdf(report_id)
+            if report is None:
+                continue
+            if report.status == 'ready':
+                self.stdout.write(self.style.SUCCESS(f'✓ {report}'))
+            else:
+                self.stdout.write(self.style.ERROR(f'✗ {report}'))
+        
+        self.stdout.write(self.style.SUCCESS('✅ Report rendering completed!'))
\ No newline at end of file
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedreport',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')], default='ready', help_text='Rendering status of the report file', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='generatedreport',
+            name='report_file',
+            field=models.FileField(blank=True, help_text='Generated report file', upload_to='reports/%Y/%m/'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_generatedreport_status'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='morbiditystatistic',
+            name='analytics_m_record__94df65_idx',
+        ),
+        migrations.AddIndex(
+            model_name='morbiditystatistic',
+            index=models.Index(fields=['record_type', 'period_start', '-case_count'], name='morb_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:26
+
+import json
+
+from django.db import migrations, models
+
+
+def parse_filters(apps, schema_editor):
+    GeneratedReport = apps.get_model('analytics', 'GeneratedReport')
+    reports = []
+    for report in GeneratedReport.objects.exclude(filters_applied__isnull=True).exclude(filters_applied='').only('id', 'filters_applied').iterator(chunk_size=2000):
+        try:
+            report.filters_json = json.loads(report.filters_applied)
+        except ValueError:
+            report.filters_json = {'raw': report.filters_applied}
+        reports.append(report)
+    GeneratedReport.objects.bulk_update(reports, ['filters_json'], batch_size=2000)
+
+
+def dump_filters(apps, schema_editor):
+    GeneratedReport = apps.get_model('analytics', 'GeneratedReport')
+    reports = []
+    for report in GeneratedReport.objects.exclude(filters_json__isnull=True).only('id', 'filters_json').iterator(chunk_size=2000):
+        report.filters_applied = json.dumps(report.filters_json)
+        reports.append(report)
+    GeneratedReport.objects.bulk_update(reports, ['filters_applied'], batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_morbidity_rank_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedreport',
+            name='filters_json',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.RunPython(parse_filters, dump_filters),
+        migrations.RemoveField(
+            model_name='generatedreport',
+            name='filters_applied',
+        ),
+        migrations.RenameField(
+            model_name='generatedreport',
+            old_name='filters_json',
+            new_name='filters_applied',
+        ),
+        migrations.AlterField(
+            model_name='generatedreport',
+            name='filters_applied',
+            field=models.JSONField(blank=True, help_text='Filters used to generate the report', null=True),
+        ),
+    ]
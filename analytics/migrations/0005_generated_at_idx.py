@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_generatedreport_filters_applied_json'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consultationstatistic',
+            index=models.Index(fields=['-generated_at'], name='cons_stat_gen_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='generatedreport',
+            index=models.Index(fields=['-generated_at'], name='gen_report_gen_idx'),
+        ),
+    ]
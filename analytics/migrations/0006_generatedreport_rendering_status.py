@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_generated_at_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='generatedreport',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('rendering', 'Rendering'), ('ready', 'Ready'), ('failed', 'Failed')], default='ready', help_text='Rendering status of the report file', max_length=10),
+        ),
+    ]
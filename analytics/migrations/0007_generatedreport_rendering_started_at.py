@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_generatedreport_rendering_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='generatedreport',
+            name='rendering_started_at',
+            field=models.DateTimeField(blank=True, help_text='When the current render claimed the report', null=True),
+        ),
+    ]
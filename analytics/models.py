@@ -4,6 +4,7 @@ Stores aggregated statistics and reports.
 """
 
 from django.db import models
+from django.db.models import F
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
@@ -85,7 +86,8 @@ class MorbidityStatistic(models.Model):
         indexes = [
             models.Index(fields=['period_type', 'period_start']),
             models.Index(fields=['diagnosis']),
-            models.Index(fields=['record_type']),
+            # Also serves record_type-only lookups
+            models.Index(fields=['record_type', 'period_start', '-case_count'], name='morb_rank_idx'),
         ]
         unique_together = [['period_type', 'period_start', 'diagnosis', 'record_type']]
     
@@ -185,6 +187,7 @@ class ConsultationStatistic(models.Model):
         ordering = ['-period_start']
         indexes = [
             models.Index(fields=['period_type', 'period_start']),
+            models.Index(fields=['-generated_at'], name='cons_stat_gen_idx'),
         ]
         unique_together = [['period_type', 'period_start']]
     
@@ -212,6 +215,13 @@ class GeneratedReport(models.Model):
         ('excel', 'Excel'),
     )
     
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('rendering', 'Rendering'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    )
+    
     # Unique identifier
     id = models.UUIDField(
         primary_key=True,
@@ -243,14 +253,28 @@ class GeneratedReport(models.Model):
     # Report File
     report_file = models.FileField(
         upload_to='reports/%Y/%m/',
+        blank=True,
         help_text=_('Generated report file')
     )
     
-    # Filters Applied (stored as JSON text)
-    filters_applied = models.TextField(
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='ready',
+        help_text=_('Rendering status of the report file')
+    )
+    
+    rendering_started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_('When the current render claimed the report')
+    )
+    
+    # Filters Applied
+    filters_applied = models.JSONField(
         blank=True,
         null=True,
-        help_text=_('JSON string of filters used')
+        help_text=_('Filters used to generate the report')
     )
     
     # Metadata
@@ -275,12 +299,13 @@ class GeneratedReport(models.Model):
         indexes = [
             models.Index(fields=['report_type', 'generated_at']),
             models.Index(fields=['generated_by']),
+            models.Index(fields=['-generated_at'], name='gen_report_gen_idx'),
         ]
     
     def __str__(self):
         return f"{self.report_name} ({self.format.upper()}) - {self.generated_at.strftime('%Y-%m-%d')}"
     
     def increment_download(self):
-        """Increment download counter."""
-        self.download_count += 1
-        self.save(update_fields=['download_count'])
\ No newline at end of file
+        """Increment download counter atomically in the database."""
+        GeneratedReport.objects.filter(pk=self.pk).update(download_count=F('download_count') + 1)
+        self.download_count = (self.download_count or 0) + 1
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+Background rendering of PDF reports into GeneratedReport files.
+
+WeasyPrint takes seconds per document, so export requests can queue a
+GeneratedReport and have the file rendered off the request thread.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .exports import render_consultation_report_pdf, render_morbidity_report_pdf
+from .models import GeneratedReport
+from .services import get_consultation_statistics, get_top_morbidities
+
+logger = logging.getLogger(__name__)
+
+# Renders run inside the web workers; cap how many run at once
+REPORT_RENDER_WORKERS = 2
+
+_render_executor = ThreadPoolExecutor(
+    max_workers=REPORT_RENDER_WORKERS, thread_name_prefix='report-render'
+)
+
+
+def render_report_pdf(report_id):
+    """
+    Render a pending GeneratedReport to PDF and attach the file.
+    
+    Args:
+        report_id: UUID of the GeneratedReport
+    
+    Returns:
+        The GeneratedReport, or None if it is gone or already claimed
+    """
+    # Claim the report so a concurrent worker or the command skips it
+    claimed = GeneratedReport.objects.filter(
+        pk=report_id, status='pending'
+    ).update(status='rendering', rendering_started_at=timezone.now())
+    if not claimed:
+        return None
+    
+    report = GeneratedReport.objects.get(pk=report_id)
+    
+    try:
+        filters = report.filters_applied or {}
+        
+        if report.report_type == 'morbidity':
+            record_type = filters.get('record_type', 'medical')
+            morbidities = get_top_morbidities(
+                record_type, limit=10, date_from=report.date_from, date_to=report.date_to
+            )
+            filename, pdf = render_morbidity_report_pdf(
+                morbidities, report.date_from, report.date_to, record_type
+            )
+        elif report.report_type == 'consultation':
+            stats = get_consultation_statistics(report.date_from, report.date_to)
+            filename, pdf = render_consultation_report_pdf(stats, report.date_from, report.date_to)
+        else:
+            raise ValueError(f'Unsupported PDF report type: {report.report_type}')
+        
+        report.report_file.save(filename, ContentFile(pdf), save=False)
+        report.status = 'ready'
+    except Exception:
+        logger.exception('Failed to render report %s', report_id)
+        report.status = 'failed'
+    
+    report.save(update_fields=['report_file', 'status'])
+    return report
+
+
+def _render_in_executor(report_id):
+    try:
+        render_report_pdf(report_id)
+    finally:
+        close_old_connections()
+
+
+def enqueue_report_pdf(report_id):
+    """
+    Queue the report on the shared render pool once the current transaction commits.
+    At most REPORT_RENDER_WORKERS reports render at a time; the rest wait
+    their turn. Reports still queued when a worker exits stay pending and
+    are picked up by the render_pending_reports management command.
+    """
+    transaction.on_commit(
+        lambda: _render_executor.submit(_render_in_executor, report_id)
+    )
\ No newline at end of file
@@ -2,17 +2,54 @@
 Analytics service functions for computing statistics.
 """
 
+import calendar
+import hashlib
+import logging
+from functools import wraps
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Count, Q, F
-from django.db.models.functions import TruncDate, TruncWeek, TruncMonth, TruncYear
+from django.db.models.functions import TruncWeek, TruncMonth, TruncYear
 from django.utils import timezone
-from datetime import timedelta, datetime
+from datetime import timedelta
 from students.models import MedicalRecord, StudentProfile
 from appointments.models import Appointment
 from templates_docs.models import IssuedCertificate, Prescription
 from .models import MorbidityStatistic, ConsultationStatistic
 
+logger = logging.getLogger(__name__)
 
-def get_top_morbidities(record_type='medical', limit=5, date_from=None, date_to=None):
+# Dashboard queries are cached briefly; saving any source record bumps the
+# version so every cached result is treated as stale
+ANALYTICS_CACHE_TIMEOUT = 300
+ANALYTICS_CACHE_VERSION_KEY = 'analytics:version'
+
+
+def invalidate_analytics_cache():
+    """Make every cached analytics result stale."""
+    try:
+        cache.incr(ANALYTICS_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(ANALYTICS_CACHE_VERSION_KEY, 1, None)
+
+
+def cached_analytics(timeout=ANALYTICS_CACHE_TIMEOUT):
+    """Cache a service function's result keyed on its name and arguments."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            version = cache.get_or_set(ANALYTICS_CACHE_VERSION_KEY, 0, None)
+            arguments = repr((args, sorted(kwargs.items())))
+            digest = hashlib.md5(arguments.encode()).hexdigest()
+            key = f'analytics:{version}:{func.__name__}:{digest}'
+            return cache.get_or_set(key, lambda: func(*args, **kwargs), timeout)
+        return wrapper
+    return decorator
+
+
+@cached_analytics()
+def get_top_morbidities(record_type='medical', limit=5, date_from=None, date_to=None,
+                        total_cases=None):
     """
     Get top N diagnoses by frequency.
     
@@ -21,6 +58,7 @@ def get_top_morbidities(record_type='medical', limit=5, date_from=None, date_to=
         limit: Number of top results to return (default: 5)
         date_from: Start date filter (optional)
         date_to: End date filter (optional)
+        total_cases: Precomputed count of diagnosed cases in the range (optional)
     
     Returns:
         QuerySet of diagnosis counts
@@ -45,8 +83,9 @@ def get_top_morbidities(record_type='medical', limit=5, date_from=None, date_to=
         total=Count('id')
     ).order_by('-total')[:limit]
     
-    # Calculate percentages
-    total_cases = sum(item['total'] for item in top_diagnoses)
+    # Percentages are of all cases in the range, not just the top N
+    if total_cases is None:
+        total_cases = queryset.aggregate(total=Count('id'))['total']
     
     results = []
     for item in top_diagnoses:
@@ -60,43 +99,45 @@ def get_top_morbidities(record_type='medical', limit=5, date_from=None, date_to=
     return results
 
 
-def get_consultation_statistics(date_from, date_to):
+@cached_analytics()
+def get_consultation_statistics(date_from, date_to, record_counts=None):
     """
     Get consultation statistics for a date range.
     
     Args:
         date_from: Start date
         date_to: End date
+        record_counts: Precomputed approved record counts (optional)
     
     Returns:
         Dictionary with consultation stats
     """
-    # Medical records
-    medical_count = MedicalRecord.objects.filter(
-        visit_date__gte=date_from,
-        visit_date__lte=date_to,
-        record_type='medical',
-        status='approved'
-    ).count()
+    # Periods may run past today; consultations and completed appointments
+    # only count what has already happened
+    today = timezone.localdate()
     
-    dental_count = MedicalRecord.objects.filter(
-        visit_date__gte=date_from,
-        visit_date__lte=date_to,
-        record_type='dental',
-        status='approved'
-    ).count()
+    # Medical records
+    if record_counts is None:
+        record_counts = MedicalRecord.objects.filter(
+            visit_date__range=(date_from, date_to),
+            status='approved'
+        ).aggregate(
+            medical=Count('id', filter=Q(record_type='medical', visit_date__lte=today)),
+            dental=Count('id', filter=Q(record_type='dental', visit_date__lte=today))
+        )
+    medical_count = record_counts['medical']
+    dental_count = record_counts['dental']
     
     # Appointments
-    appointments = Appointment.objects.filter(
-        preferred_date__gte=date_from,
-        preferred_date__lte=date_to
+    appointment_counts = Appointment.objects.filter(
+        preferred_date__range=(date_from, date_to)
+    ).aggregate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status='completed', preferred_date__lte=today)),
+        cancelled=Count('id', filter=Q(status='cancelled')),
+        no_show=Count('id', filter=Q(status='no_show'))
     )
     
-    total_appointments = appointments.count()
-    completed = appointments.filter(status='completed').count()
-    cancelled = appointments.filter(status='cancelled').count()
-    no_show = appointments.filter(status='no_show').count()
-    
     # Certificates and prescriptions
     certificates = IssuedCertificate.objects.filter(
         date_issued__gte=date_from,
@@ -118,16 +159,17 @@ def get_consultation_statistics(date_from, date_to):
         'total_consultations': medical_count + dental_count,
         'medical_consultations': medical_count,
         'dental_consultations': dental_count,
-        'total_appointments': total_appointments,
-        'completed_appointments': completed,
-        'cancelled_appointments': cancelled,
-        'no_show_appointments': no_show,
+        'total_appointments': appointment_counts['total'],
+        'completed_appointments': appointment_counts['completed'],
+        'cancelled_appointments': appointment_counts['cancelled'],
+        'no_show_appointments': appointment_counts['no_show'],
         'certificates_issued': certificates,
         'prescriptions_issued': prescriptions,
         'new_students_registered': new_students,
     }
 
 
+@cached_analytics()
 def get_daily_consultation_trend(days=30):
     """
     Get daily consultation counts for the last N days.
@@ -143,57 +185,30 @@ def get_daily_consultation_trend(days=30):
     
     try:
         daily_data = MedicalRecord.objects.filter(
-            visit_date__gte=start_date,
-            visit_date__lte=end_date,
+            visit_date__range=(start_date, end_date),
             status='approved'
-        ).annotate(
-            date=TruncDate('visit_date')
-        ).values('date', 'record_type').annotate(
-            count=Count('id')
-        ).order_by('date')
-        
-        # Format results by date
-        results = {}
-        for item in daily_data:
-            # Add null check and handle potential None values
-            if item['date'] is None:
-                continue
-                
-            # Convert date to string safely
-            try:
-                date_str = item['date'].strftime('%Y-%m-%d') if hasattr(item['date'], 'strftime') else str(item['date'])
-            except (AttributeError, TypeError):
-                # Fallback: try to convert to date object first
-                try:
-                    from datetime import date
-                    if isinstance(item['date'], str):
-                        date_obj = datetime.strptime(item['date'], '%Y-%m-%d').date()
-                        date_str = date_obj.strftime('%Y-%m-%d')
-                    else:
-                        date_str = str(item['date'])
-                except Exception:
-                    continue
-            
-            if date_str not in results:
-                results[date_str] = {'date': date_str, 'medical': 0, 'dental': 0, 'total': 0}
-            
-            if item['record_type'] == 'medical':
-                results[date_str]['medical'] = item['count']
-            else:
-                results[date_str]['dental'] = item['count']
-            
-            results[date_str]['total'] += item['count']
+        ).values('visit_date').annotate(
+            medical=Count('id', filter=Q(record_type='medical')),
+            dental=Count('id', filter=Q(record_type='dental')),
+            total=Count('id')
+        ).order_by('visit_date')
         
-        return list(results.values())
-    
-    except Exception as e:
-        # Log the error and return empty list
-        print(f"Error in get_daily_consultation_trend: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        return [
+            {
+                'date': item['visit_date'].isoformat(),
+                'medical': item['medical'],
+                'dental': item['dental'],
+                'total': item['total'],
+            }
+            for item in daily_data
+        ]
+    
+    except Exception:
+        logger.exception('Error in get_daily_consultation_trend')
         return []
 
 
+@cached_analytics()
 def get_monthly_consultation_trend(months=12):
     """
     Get monthly consultation counts for the last N months.
@@ -205,57 +220,37 @@ def get_monthly_consultation_trend(months=12):
         List of monthly consultation counts
     """
     end_date = timezone.now().date()
-    start_date = end_date - timedelta(days=months*30)
+    start_date = _months_before(end_date.replace(day=1), months - 1)
     
     try:
         monthly_data = MedicalRecord.objects.filter(
-            visit_date__gte=start_date,
-            visit_date__lte=end_date,
+            visit_date__range=(start_date, end_date),
             status='approved'
         ).annotate(
             month=TruncMonth('visit_date')
-        ).values('month', 'record_type').annotate(
-            count=Count('id')
+        ).values('month').annotate(
+            medical=Count('id', filter=Q(record_type='medical')),
+            dental=Count('id', filter=Q(record_type='dental')),
+            total=Count('id')
         ).order_by('month')
         
-        # Format results by month
-        results = {}
-        for item in monthly_data:
-            # Add null check
-            if item['month'] is None:
-                continue
-            
-            try:
-                month_str = item['month'].strftime('%Y-%m')
-                month_name = item['month'].strftime('%B %Y')
-            except (AttributeError, TypeError):
-                continue
-            
-            if month_str not in results:
-                results[month_str] = {
-                    'month': month_str,
-                    'month_name': month_name,
-                    'medical': 0,
-                    'dental': 0,
-                    'total': 0
-                }
-            
-            if item['record_type'] == 'medical':
-                results[month_str]['medical'] = item['count']
-            else:
-                results[month_str]['dental'] = item['count']
-            
-            results[month_str]['total'] += item['count']
-        
-        return list(results.values())
-    
-    except Exception as e:
-        print(f"Error in get_monthly_consultation_trend: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        return [
+            {
+                'month': item['month'].strftime('%Y-%m'),
+                'month_name': item['month'].strftime('%B %Y'),
+                'medical': item['medical'],
+                'dental': item['dental'],
+                'total': item['total'],
+            }
+            for item in monthly_data
+        ]
+    
+    except Exception:
+        logger.exception('Error in get_monthly_consultation_trend')
         return []
 
 
+@cached_analytics()
 def get_service_distribution(date_from=None, date_to=None):
     """
     Get distribution of appointment service types.
@@ -274,26 +269,113 @@ def get_service_distribution(date_from=None, date_to=None):
     if date_to:
         queryset = queryset.filter(preferred_date__lte=date_to)
     
-    distribution = queryset.values('service_type').annotate(
+    distribution = list(queryset.values('service_type').annotate(
         count=Count('id')
-    ).order_by('-count')
+    ).order_by('-count'))
     
     total = sum(item['count'] for item in distribution)
     
-    results = []
-    for item in distribution:
-        percentage = (item['count'] / total * 100) if total > 0 else 0
-        results.append({
+    return [
+        {
             'service_type': item['service_type'],
-            'service_name': dict(Appointment.SERVICE_TYPE_CHOICES).get(item['service_type'], item['service_type']),
+            'service_name': Appointment.SERVICE_TYPE_NAMES.get(item['service_type'], item['service_type']),
             'count': item['count'],
-            'percentage': round(percentage, 2)
-        })
+            'percentage': round(item['count'] / total * 100, 2)
+        }
+        for item in distribution
+    ]
+
+
+def _end_of_month(day):
+    """Return the last day of the month containing the given date."""
+    return day.replace(day=calendar.monthrange(day.year, day.month)[1])
+
+
+def _months_before(month_start, months):
+    """Return the first day of the month `months` before the given month start."""
+    year, month = divmod(month_start.year * 12 + month_start.month - 1 - months, 12)
+    return month_start.replace(year=year, month=month + 1)
+
+
+def resolve_period(period_type, period_start=None, period_end=None):
+    """
+    Fill in missing period bounds.
     
-    return results
+    Defaults to the current month; periods end on the last day of their
+    day, week, month or year.
+    
+    Returns:
+        Tuple of (period_start, period_end)
+    """
+    if not period_start:
+        period_start = timezone.now().date().replace(day=1)
+    
+    if not period_end:
+        if period_type == 'daily':
+            period_end = period_start
+        elif period_type == 'weekly':
+            period_end = period_start + timedelta(days=6)
+        elif period_type == 'monthly':
+            period_end = _end_of_month(period_start)
+        else:
+            period_end = period_start.replace(month=12, day=31)
+    
+    return period_start, period_end
+
 
+def count_approved_records(date_from, date_to):
+    """
+    Count approved records in a visit window, per type and per type with a
+    diagnosis, in one query. Like get_consultation_statistics(), all counts
+    stop at today, so future-dated visits are left out.
+    
+    generate_statistics computes this once per period and passes it to
+    both generators.
+    """
+    diagnosed = ~Q(diagnosis__isnull=True) & ~Q(diagnosis='')
+    return MedicalRecord.objects.filter(
+        visit_date__range=(date_from, min(date_to, timezone.localdate())),
+        status='approved'
+    ).aggregate(
+        medical=Count('id', filter=Q(record_type='medical')),
+        dental=Count('id', filter=Q(record_type='dental')),
+        medical_diagnosed=Count('id', filter=Q(record_type='medical') & diagnosed),
+        dental_diagnosed=Count('id', filter=Q(record_type='dental') & diagnosed)
+    )
 
-def generate_morbidity_statistics(period_type='monthly', period_start=None, period_end=None):
+
+def _period_start(period_type, day):
+    """Return the first day of the period containing the given date."""
+    if period_type == 'daily':
+        return day
+    elif period_type == 'weekly':
+        return day - timedelta(days=day.weekday())
+    elif period_type == 'monthly':
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+def iter_period_starts(period_type, latest_start, count):
+    """
+    Yield the start dates of `count` consecutive periods ending with the
+    period that contains `latest_start`, oldest first.
+    
+    Used by backfills so each period is generated and saved on its own.
+    """
+    latest_start = _period_start(period_type, latest_start)
+    for offset in range(count - 1, -1, -1):
+        if period_type == 'daily':
+            yield latest_start - timedelta(days=offset)
+        elif period_type == 'weekly':
+            yield latest_start - timedelta(weeks=offset)
+        elif period_type == 'monthly':
+            yield _months_before(latest_start, offset)
+        else:
+            yield latest_start.replace(year=latest_start.year - offset)
+
+
+def generate_morbidity_statistics(period_type='monthly', period_start=None, period_end=None,
+                                  record_counts=None):
     """
     Generate and save morbidity statistics for a period.
     
@@ -301,51 +383,59 @@ def generate_morbidity_statistics(period_type='monthly', period_start=None, peri
         period_type: 'daily', 'weekly', 'monthly', or 'yearly'
         period_start: Start date of period
         period_end: End date of period
+        record_counts: count_approved_records() for the period (optional)
     
     Returns:
-        List of created MorbidityStatistic objects
+        List of saved MorbidityStatistic objects
     """
-    if not period_start:
-        period_start = timezone.now().date().replace(day=1)
+    period_start, period_end = resolve_period(period_type, period_start, period_end)
     
-    if not period_end:
-        if period_type == 'monthly':
-            # End of month
-            next_month = period_start.replace(day=28) + timedelta(days=4)
-            period_end = next_month - timedelta(days=next_month.day)
-        else:
-            period_end = timezone.now().date()
+    if record_counts is None:
+        record_counts = count_approved_records(period_start, period_end)
+    stats = []
     
-    created_stats = []
+    # Case counts stop at today, like the totals they are a percentage of
+    cases_to = min(period_end, timezone.localdate())
     
-    # Get top morbidities for medical and dental
+    # Get top morbidities for medical and dental, uncached
     for record_type in ['medical', 'dental']:
-        top_morbidities = get_top_morbidities(
+        top_morbidities = get_top_morbidities.__wrapped__(
             record_type=record_type,
             limit=10,
             date_from=period_start,
-            date_to=period_end
+            date_to=cases_to,
+            total_cases=record_counts[f'{record_type}_diagnosed']
         )
         
-        for item in top_morbidities:
-            stat, created = MorbidityStatistic.objects.update_or_create(
+        stats.extend(
+            MorbidityStatistic(
                 period_type=period_type,
                 period_start=period_start,
+                period_end=period_end,
                 diagnosis=item['diagnosis'],
                 record_type=record_type,
-                defaults={
-                    'period_end': period_end,
-                    'case_count': item['count'],
-                    'percentage': item['percentage']
-                }
+                case_count=item['count'],
+                percentage=item['percentage']
             )
-            if created:
-                created_stats.append(stat)
+            for item in top_morbidities
+        )
+    
+    # One multi-row upsert instead of an update_or_create per diagnosis
+    with transaction.atomic():
+        MorbidityStatistic.objects.bulk_create(
+            stats,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['period_type', 'period_start', 'diagnosis', 'record_type'],
+            update_fields=['period_end', 'case_count', 'percentage']
+        )
     
-    return created_stats
+    return stats
 
 
-def generate_consultation_statistics(period_type='monthly', period_start=None, period_end=None):
+@transaction.atomic
+def generate_consultation_statistics(period_type='monthly', period_start=None, period_end=None,
+                                     record_counts=None):
     """
     Generate and save consultation statistics for a period.
     
@@ -353,21 +443,21 @@ def generate_consultation_statistics(period_type='monthly', period_start=None, p
         period_type: 'daily', 'weekly', 'monthly', or 'yearly'
         period_start: Start date of period
         period_end: End date of period
+        record_counts: count_approved_records() for the period (optional)
     
     Returns:
         ConsultationStatistic object
     """
-    if not period_start:
-        period_start = timezone.now().date().replace(day=1)
+    period_start, period_end = resolve_period(period_type, period_start, period_end)
     
-    if not period_end:
-        if period_type == 'monthly':
-            next_month = period_start.replace(day=28) + timedelta(days=4)
-            period_end = next_month - timedelta(days=next_month.day)
-        else:
-            period_end = timezone.now().date()
+    if record_counts is None:
+        record_counts = count_approved_records(period_start, period_end)
     
-    stats_data = get_consultation_statistics(period_start, period_end)
+    # Read straight from the database so the stored row never reflects a
+    # stale cached aggregate
+    stats_data = get_consultation_statistics.__wrapped__(
+        period_start, period_end, record_counts=record_counts
+    )
     
     stat, created = ConsultationStatistic.objects.update_or_create(
         period_type=period_type,
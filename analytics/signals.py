@@ -0,0 +1,21 @@
+"""
+Signals for analytics app.
+Invalidates cached dashboard statistics when their source records change.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from appointments.models import Appointment
+from students.models import MedicalRecord, StudentProfile
+from templates_docs.models import IssuedCertificate, Prescription
+from .services import invalidate_analytics_cache
+
+
+@receiver([post_save, post_delete], sender=MedicalRecord)
+@receiver([post_save, post_delete], sender=Appointment)
+@receiver([post_save, post_delete], sender=IssuedCertificate)
+@receiver([post_save, post_delete], sender=Prescription)
+@receiver([post_save, post_delete], sender=StudentProfile)
+def clear_analytics_cache(sender, **kwargs):
+    """Drop cached analytics results after any source record changes."""
+    invalidate_analytics_cache()
\ No newline at end of file
@@ -1,3 +1,222 @@
-from django.test import TestCase
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from accounts.models import User
+from appointments.models import Appointment
+from students.models import MedicalRecord, StudentProfile
+from .models import ConsultationStatistic, GeneratedReport
+from .reports import render_report_pdf
+from .services import (
+    generate_consultation_statistics,
+    generate_morbidity_statistics,
+    get_consultation_statistics,
+    iter_period_starts,
+)
+
+
+def create_student(email='student@tip.edu.ph', student_id='2024-0001'):
+    """Create a student user with a complete profile."""
+    user = User.objects.create_user(
+        email, 'pw12345678', first_name='Juan', last_name='Cruz', role='student'
+    )
+    return StudentProfile.objects.create(
+        user=user,
+        student_id=student_id,
+        program='CS',
+        year_level='1',
+        sex='M',
+        date_of_birth=date(2004, 1, 1),
+        contact_number='09171234567',
+        address='Quezon City',
+        emergency_contact_name='Maria Cruz',
+        emergency_contact_relationship='Mother',
+        emergency_contact_number='09171234567'
+    )
+
+
+class IterPeriodStartsTests(TestCase):
+    """Backfill periods start on their natural boundary whatever date is given."""
+    
+    def test_monthly_from_month_end(self):
+        starts = list(iter_period_starts('monthly', date(2025, 3, 31), 2))
+        
+        self.assertEqual(starts, [date(2025, 2, 1), date(2025, 3, 1)])
+    
+    def test_monthly_across_year_boundary(self):
+        starts = list(iter_period_starts('monthly', date(2025, 1, 15), 3))
+        
+        self.assertEqual(starts, [date(2024, 11, 1), date(2024, 12, 1), date(2025, 1, 1)])
+    
+    def test_yearly_from_leap_day(self):
+        starts = list(iter_period_starts('yearly', date(2024, 2, 29), 2))
+        
+        self.assertEqual(starts, [date(2023, 1, 1), date(2024, 1, 1)])
+    
+    def test_weekly_starts_on_monday(self):
+        starts = list(iter_period_starts('weekly', date(2025, 3, 12), 2))
+        
+        self.assertEqual(starts, [date(2025, 3, 3), date(2025, 3, 10)])
+    
+    def test_daily(self):
+        starts = list(iter_period_starts('daily', date(2024, 3, 1), 2))
+        
+        self.assertEqual(starts, [date(2024, 2, 29), date(2024, 3, 1)])
+
+
+class GenerateStatisticsCommandTests(TestCase):
+    """The generate_statistics command backfills whole periods."""
+    
+    def test_monthly_backfill_from_month_end(self):
+        call_command(
+            'generate_statistics', '--period', 'monthly',
+            '--date', '2025-03-31', '--periods', '2', stdout=StringIO()
+        )
+        
+        periods = list(
+            ConsultationStatistic.objects.order_by('period_start')
+            .values_list('period_start', 'period_end')
+        )
+        self.assertEqual(periods, [
+            (date(2025, 2, 1), date(2025, 2, 28)),
+            (date(2025, 3, 1), date(2025, 3, 31)),
+        ])
+    
+    def test_yearly_backfill_from_leap_day(self):
+        call_command(
+            'generate_statistics', '--period', 'yearly',
+            '--date', '2024-02-29', '--periods', '2', stdout=StringIO()
+        )
+        
+        periods = list(
+            ConsultationStatistic.objects.order_by('period_start')
+            .values_list('period_start', 'period_end')
+        )
+        self.assertEqual(periods, [
+            (date(2023, 1, 1), date(2023, 12, 31)),
+            (date(2024, 1, 1), date(2024, 12, 31)),
+        ])
+
+
+class ConsultationStatisticsTests(TestCase):
+    """Consultation counts leave out work dated after today."""
+    
+    def setUp(self):
+        self.student = create_student()
+        self.today = timezone.localdate()
+        self.tomorrow = self.today + timedelta(days=1)
+    
+    def create_record(self, visit_date):
+        return MedicalRecord.objects.create(
+            student=self.student,
+            record_type='medical',
+            visit_date=visit_date,
+            chief_complaint='Headache',
+            diagnosis='Migraine',
+            status='approved'
+        )
+    
+    def create_appointment(self, preferred_date, status):
+        return Appointment.objects.create(
+            student=self.student,
+            service_type='medical_consultation',
+            preferred_date=preferred_date,
+            preferred_time_slot='morning',
+            reason='Recurring headaches',
+            emergency_contact_name='Maria Cruz',
+            emergency_contact_number='09171234567',
+            status=status
+        )
+    
+    def test_morbidity_percentages_leave_out_future_visits(self):
+        self.create_record(self.today)
+        self.create_record(self.tomorrow)
+        
+        stats = generate_morbidity_statistics('daily', self.today, self.tomorrow)
+        
+        self.assertEqual(
+            [(stat.diagnosis, stat.case_count, stat.percentage) for stat in stats],
+            [('Migraine', 1, 100.0)]
+        )
+    
+    def test_regeneration_sees_new_records(self):
+        period_start = self.today.replace(day=1)
+        self.create_record(self.today)
+        generate_consultation_statistics('monthly', period_start)
+        
+        self.create_record(self.today)
+        stat = generate_consultation_statistics('monthly', period_start)
+        
+        self.assertEqual(stat.medical_consultations, 2)
+    
+    def test_future_dated_work_is_not_counted(self):
+        self.create_record(self.today)
+        self.create_record(self.tomorrow)
+        self.create_appointment(self.today, 'completed')
+        self.create_appointment(self.tomorrow, 'completed')
+        self.create_appointment(self.tomorrow, 'approved')
+        
+        stats = get_consultation_statistics.__wrapped__(self.today, self.tomorrow)
+        
+        self.assertEqual(stats['medical_consultations'], 1)
+        self.assertEqual(stats['completed_appointments'], 1)
+        self.assertEqual(stats['total_appointments'], 3)
+
+
+class RenderReportPdfTests(TestCase):
+    """Only the worker that claims a pending report renders it."""
+    
+    def setUp(self):
+        # Rendered files go to a throwaway media directory
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media_settings = override_settings(MEDIA_ROOT=media_root.name)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+    
+    def create_report(self, status):
+        return GeneratedReport.objects.create(
+            report_type='consultation',
+            report_name='Consultation Statistics Report',
+            format='pdf',
+            date_from=date(2025, 3, 1),
+            date_to=date(2025, 3, 31),
+            status=status
+        )
+    
+    def test_report_claimed_elsewhere_is_skipped(self):
+        report = self.create_report('rendering')
+        
+        self.assertIsNone(render_report_pdf(report.pk))
+        
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'rendering')
+    
+    def test_command_requeues_stale_rendering_reports(self):
+        report = self.create_report('rendering')
+        GeneratedReport.objects.filter(pk=report.pk).update(
+            generated_at=timezone.now() - timedelta(minutes=20),
+            rendering_started_at=timezone.now() - timedelta(minutes=10)
+        )
+        
+        call_command('render_pending_reports', stdout=StringIO())
+        
+        report.refresh_from_db()
+        self.assertNotIn(report.status, ['pending', 'rendering'])
+    
+    def test_command_leaves_recently_claimed_reports_alone(self):
+        report = self.create_report('rendering')
+        # Queued long ago but only just claimed by a render
+        GeneratedReport.objects.filter(pk=report.pk).update(
+            generated_at=timezone.now() - timedelta(minutes=10),
+            rendering_started_at=timezone.now()
+        )
+        
+        call_command('render_pending_reports', stdout=StringIO())
+        
+        report.refresh_from_db()
+        self.assertEqual(report.status, 'rendering')
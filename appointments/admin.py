@@ -4,7 +4,7 @@ Admin configuration for appointments models.
 
 from django.contrib import admin
 from django.utils.html import format_html
-from django.utils import timezone
+from analytics.services import invalidate_analytics_cache
 from .models import Appointment, AppointmentNote
 
 
@@ -29,18 +29,28 @@ class AppointmentAdmin(admin.ModelAdmin):
         'status', 'service_type', 'preferred_time_slot',
         'preferred_date', 'created_at'
     ]
+    # Exact matches on the indexed identifiers, prefix matches on names
+    # and the visit reason
     search_fields = [
-        'ticket_number', 'student__student_id',
-        'student__user__first_name', 'student__user__last_name',
-        'reason'
+        '=ticket_number', '=student__student_id',
+        '^student__user__first_name', '^student__user__last_name',
+        '^reason'
     ]
+    search_help_text = (
+        'Search by exact ticket number or student ID, by the start of the '
+        'student\'s first or last name, or by the start of the visit reason.'
+    )
     readonly_fields = [
         'id', 'ticket_number', 'created_at', 'updated_at',
         'approved_at', 'completed_at', 'cancelled_at'
     ]
+    list_select_related = ['student__user', 'doctor']
     date_hierarchy = 'preferred_date'
     inlines = [AppointmentNoteInline]
     
+    class Media:
+        css = {'all': ('css/admin/appointments.css',)}
+    
     fieldsets = (
         ('Appointment Information', {
             'fields': (
@@ -94,18 +104,9 @@ class AppointmentAdmin(admin.ModelAdmin):
     
     def status_badge(self, obj):
         """Display colored status badge."""
-        colors = {
-            'pending': '#ffc107',
-            'approved': '#28a745',
-            'completed': '#17a2b8',
-            'cancelled': '#6c757d',
-            'no_show': '#dc3545',
-        }
-        color = colors.get(obj.status, '#6c757d')
         return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; '
-            'border-radius: 3px; font-weight: bold;">{}</span>',
-            color,
+            '<span class="status-badge status-{}">{}</span>',
+            obj.status,
             obj.get_status_display()
         )
     status_badge.short_description = 'Status'
@@ -114,30 +115,31 @@ class AppointmentAdmin(admin.ModelAdmin):
     
     def approve_appointments(self, request, queryset):
         """Bulk approve selected appointments."""
-        count = 0
-        for appointment in queryset.filter(status='pending'):
-            appointment.approve(request.user)
-            count += 1
+        count = Appointment.bulk_approve(queryset.values('pk'), request.user)
+        if count:
+            invalidate_analytics_cache()
         
         self.message_user(request, f'{count} appointment(s) approved successfully.')
     approve_appointments.short_description = 'Approve selected appointments'
     
     def complete_appointments(self, request, queryset):
         """Bulk complete selected appointments."""
-        count = 0
-        for appointment in queryset.filter(status='approved'):
-            appointment.complete()
-            count += 1
+        count = Appointment.bulk_complete(queryset.values('pk'))
+        if count:
+            invalidate_analytics_cache()
         
         self.message_user(request, f'{count} appointment(s) marked as completed.')
     complete_appointments.short_description = 'Mark as completed'
     
     def cancel_appointments(self, request, queryset):
         """Bulk cancel selected appointments."""
-        count = 0
-        for appointment in queryset.filter(status__in=['pending', 'approved']):
-            appointment.cancel(reason='Cancelled by admin')
-            count += 1
+        count = Appointment.bulk_cancel(
+            queryset.values('pk'),
+            reason='Cancelled by admin',
+            cancelled_by=request.user
+        )
+        if count:
+            invalidate_analytics_cache()
         
         self.message_user(request, f'{count} appointment(s) cancelled.')
     cancel_appointments.short_description = 'Cancel selected appointments'
@@ -156,6 +158,8 @@ class AppointmentNoteAdmin(admin.ModelAdmin):
         'author__first_name', 'author__last_name'
     ]
     readonly_fields = ['created_at']
+    # Appointment.__str__ reads the student's ID
+    list_select_related = ['appointment__student', 'author']
     
     def note_preview(self, obj):
         """Display preview of note."""
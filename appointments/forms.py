@@ -7,6 +7,9 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from .models import Appointment, AppointmentNote
 
+SERVICE_TYPE_FILTER_CHOICES = (('', 'All Services'),) + tuple(Appointment.SERVICE_TYPE_CHOICES)
+STATUS_FILTER_CHOICES = (('', 'All Status'),) + tuple(Appointment.STATUS_CHOICES)
+
 
 class AppointmentBookingForm(forms.ModelForm):
     """
@@ -27,7 +30,6 @@ class AppointmentBookingForm(forms.ModelForm):
             'preferred_date': forms.DateInput(attrs={
                 'class': 'form-control',
                 'type': 'date',
-                'min': timezone.now().date().isoformat(),
                 'required': True
             }),
             'preferred_time_slot': forms.Select(attrs={
@@ -52,11 +54,16 @@ class AppointmentBookingForm(forms.ModelForm):
             }),
         }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Evaluated per form so the date picker never allows past days
+        self.fields['preferred_date'].widget.attrs['min'] = timezone.localdate().isoformat()
+    
     def clean_preferred_date(self):
         """Validate that preferred date is in the future."""
         date = self.cleaned_data.get('preferred_date')
         
-        if date and date < timezone.now().date():
+        if date and date < timezone.localdate():
             raise ValidationError('Please select a future date.')
         
         # Check if date is a weekend (optional - adjust based on clinic schedule)
@@ -119,8 +126,7 @@ class AppointmentRescheduleForm(forms.ModelForm):
         widgets = {
             'preferred_date': forms.DateInput(attrs={
                 'class': 'form-control',
-                'type': 'date',
-                'min': timezone.now().date().isoformat()
+                'type': 'date'
             }),
             'preferred_time_slot': forms.Select(attrs={
                 'class': 'form-control'
@@ -130,6 +136,11 @@ class AppointmentRescheduleForm(forms.ModelForm):
                 'type': 'datetime-local'
             }),
         }
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Evaluated per form so the date picker never allows past days
+        self.fields['preferred_date'].widget.attrs['min'] = timezone.localdate().isoformat()
 
 
 class AppointmentCancellationForm(forms.Form):
@@ -193,14 +204,14 @@ class AppointmentSearchForm(forms.Form):
     service_type = forms.ChoiceField(
         label='Service Type',
         required=False,
-        choices=[('', 'All Services')] + list(Appointment.SERVICE_TYPE_CHOICES),
+        choices=SERVICE_TYPE_FILTER_CHOICES,
         widget=forms.Select(attrs={'class': 'form-control'})
     )
     
     status = forms.ChoiceField(
         label='Status',
         required=False,
-        choices=[('', 'All Status')] + list(Appointment.STATUS_CHOICES),
+        choices=STATUS_FILTER_CHOICES,
         widget=forms.Select(attrs={'class': 'form-control'})
     )
     
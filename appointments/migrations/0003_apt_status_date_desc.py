@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0002_appointment_cancelled_by'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['status', '-preferred_date', '-created_at'], name='apt_status_date_desc'),
+        ),
+    ]
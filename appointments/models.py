@@ -3,14 +3,29 @@ Appointment models for TIP MDS EMR system.
 Handles appointment scheduling and management.
 """
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 from students.models import StudentProfile
+import base64
+import secrets
 import uuid
-import random
-import string
+
+# Fresh ticket numbers to try before giving up on a save
+TICKET_NUMBER_ATTEMPTS = 5
+
+
+class AppointmentListManager(models.Manager):
+    """
+    Manager for pages that render appointments with their people.
+    Joins the student, doctor, approver and canceller up front.
+    """
+    
+    def get_queryset(self):
+        return super().get_queryset().select_related(
+            'student__user', 'doctor', 'approved_by', 'cancelled_by'
+        )
 
 
 class Appointment(models.Model):
@@ -31,6 +46,8 @@ class Appointment(models.Model):
         ('emergency', 'Emergency'),
         ('other', 'Other'),
     )
+    # Label lookup for __str__, which list pages call once per row
+    SERVICE_TYPE_NAMES = dict(SERVICE_TYPE_CHOICES)
     
     TIME_SLOT_CHOICES = (
         ('morning', 'Morning (8:00 AM - 12:00 PM)'),
@@ -180,6 +197,9 @@ class Appointment(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = models.Manager()
+    list_objects = AppointmentListManager()
+    
     class Meta:
         verbose_name = _('appointment')
         verbose_name_plural = _('appointments')
@@ -188,84 +208,189 @@ class Appointment(models.Model):
             models.Index(fields=['student', 'status']),
             models.Index(fields=['doctor', 'status']),
             models.Index(fields=['preferred_date', 'status']),
+            # Status-filtered lists in the default ordering, read straight
+            # from the index instead of sorted
+            models.Index(
+                fields=['status', '-preferred_date', '-created_at'],
+                name='apt_status_date_desc'
+            ),
             models.Index(fields=['ticket_number']),
             models.Index(fields=['created_at']),
         ]
     
     def __str__(self):
-        return f"{self.ticket_number} - {self.student.student_id} - {self.get_service_type_display()}"
+        service = self.SERVICE_TYPE_NAMES.get(self.service_type, self.service_type)
+        return f"{self.ticket_number} - {self.student.student_id} - {service}"
     
     def save(self, *args, **kwargs):
         """Generate ticket number on creation."""
-        if not self.ticket_number:
+        if self.ticket_number:
+            super().save(*args, **kwargs)
+            return
+        
+        # The unique constraint catches the rare collision, so there is no
+        # existence check per candidate; retry with a new number instead
+        for attempt in range(TICKET_NUMBER_ATTEMPTS):
             self.ticket_number = self.generate_ticket_number()
-        super().save(*args, **kwargs)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                # Only a taken ticket number is worth another try
+                ticket_taken = Appointment.objects.filter(
+                    ticket_number=self.ticket_number
+                ).exists()
+                if not ticket_taken or attempt == TICKET_NUMBER_ATTEMPTS - 1:
+                    self.ticket_number = ''
+                    raise
     
     @staticmethod
     def generate_ticket_number():
-        """Generate unique ticket number (e.g., APT-2025-ABC123)."""
+        """Generate a candidate ticket number (e.g., APT-2025-ABC123)."""
         year = timezone.now().year
-        random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-        ticket = f"APT-{year}-{random_part}"
-        
-        # Ensure uniqueness
-        while Appointment.objects.filter(ticket_number=ticket).exists():
-            random_part = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-            ticket = f"APT-{year}-{random_part}"
-        
-        return ticket
+        # Six base32 characters (A-Z, 2-7) from a single RNG call
+        random_part = base64.b32encode(secrets.token_bytes(4))[:6].decode()
+        return f"APT-{year}-{random_part}"
     
-    def approve(self, approved_by_user, doctor=None, actual_datetime=None):
+    def approve(self, approved_by_user, doctor=None, actual_datetime=None, doctor_notes=None):
         """
-        Approve the appointment.
+        Approve the appointment if it is still pending.
         
         Args:
             approved_by_user: User who approved the appointment
             doctor: Doctor to assign (optional)
             actual_datetime: Scheduled datetime (optional)
-        """
-        self.status = 'approved'
-        self.approved_by = approved_by_user
-        self.approved_at = timezone.now()
-        
-        if doctor:
-            self.doctor = doctor
+            doctor_notes: Notes for the student (optional)
         
-        if actual_datetime:
-            self.actual_datetime = actual_datetime
+        Returns:
+            True if approved, False if the appointment was no longer pending
+        """
+        with transaction.atomic():
+            # Re-read the status under a row lock so two approvers cannot
+            # both act on a stale 'pending'
+            current_status = Appointment.objects.select_for_update().filter(
+                pk=self.pk
+            ).values_list('status', flat=True).first()
+            if current_status != 'pending':
+                return False
+            
+            self.status = 'approved'
+            self.approved_by = approved_by_user
+            self.approved_at = timezone.now()
+            update_fields = ['status', 'approved_by', 'approved_at', 'updated_at']
+            
+            if doctor:
+                self.doctor = doctor
+                update_fields.append('doctor')
+            
+            if actual_datetime:
+                self.actual_datetime = actual_datetime
+                update_fields.append('actual_datetime')
+            
+            if doctor_notes is not None:
+                self.doctor_notes = doctor_notes
+                update_fields.append('doctor_notes')
+            
+            self.save(update_fields=update_fields)
         
-        self.save()
+        return True
     
     def complete(self):
         """Mark appointment as completed."""
         self.status = 'completed'
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'completed_at', 'updated_at'])
     
     def cancel(self, reason='', cancelled_by=None):
         """Cancel the appointment."""
         self.status = 'cancelled'
         self.cancelled_at = timezone.now()
         self.cancellation_reason = reason
+        update_fields = ['status', 'cancelled_at', 'cancellation_reason', 'updated_at']
         if cancelled_by:
             self.cancelled_by = cancelled_by
-        self.save()
+            update_fields.append('cancelled_by')
+        self.save(update_fields=update_fields)
     
     def mark_no_show(self):
         """Mark appointment as no show."""
         self.status = 'no_show'
-        self.save()
+        self.save(update_fields=['status', 'updated_at'])
     
-    def is_upcoming(self):
-        """Check if appointment is upcoming."""
+    @classmethod
+    def bulk_approve(cls, ids, approved_by_user, when=None):
+        """
+        Approve the pending appointments among `ids` in one UPDATE.
+        
+        Save signals do not fire, so callers must invalidate the analytics
+        cache and send any notifications themselves.
+        
+        Returns:
+            Number of appointments approved
+        """
+        now = timezone.now()
+        return cls.objects.filter(pk__in=ids, status='pending').update(
+            status='approved',
+            approved_by=approved_by_user,
+            approved_at=when or now,
+            updated_at=now
+        )
+    
+    @classmethod
+    def bulk_complete(cls, ids, when=None):
+        """
+        Complete the approved appointments among `ids` in one UPDATE.
+        
+        Save signals do not fire; see bulk_approve().
+        
+        Returns:
+            Number of appointments completed
+        """
+        now = timezone.now()
+        return cls.objects.filter(pk__in=ids, status='approved').update(
+            status='completed',
+            completed_at=when or now,
+            updated_at=now
+        )
+    
+    @classmethod
+    def bulk_cancel(cls, ids, reason='', cancelled_by=None, when=None):
+        """
+        Cancel the pending or approved appointments among `ids` in one UPDATE.
+        
+        Save signals do not fire; see bulk_approve().
+        
+        Returns:
+            Number of appointments cancelled
+        """
+        now = timezone.now()
+        return cls.objects.filter(pk__in=ids, status__in=['pending', 'approved']).update(
+            status='cancelled',
+            cancelled_at=when or now,
+            cancelled_by=cancelled_by,
+            cancellation_reason=reason,
+            updated_at=now
+        )
+    
+    def is_upcoming(self, today=None):
+        """
+        Check if appointment is upcoming.
+        
+        Pass `today` when checking many appointments to look up the date once.
+        """
         if self.status == 'approved' and self.preferred_date:
-            return self.preferred_date >= timezone.now().date()
+            return self.preferred_date >= (today or timezone.localdate())
         return False
     
-    def is_overdue(self):
-        """Check if appointment date has passed but not completed."""
+    def is_overdue(self, today=None):
+        """
+        Check if appointment date has passed but not completed.
+        
+        Pass `today` when checking many appointments to look up the date once.
+        """
         if self.status in ['pending', 'approved'] and self.preferred_date:
-            return self.preferred_date < timezone.now().date()
+            return self.preferred_date < (today or timezone.localdate())
         return False
 
 
@@ -1,3 +1,107 @@
+from datetime import date
+from unittest import mock
+
+from django.db import IntegrityError
 from django.test import TestCase
 
-# Create your tests here.
+from accounts.models import User
+from students.models import StudentProfile
+from .models import Appointment
+
+
+def create_student(email='student@tip.edu.ph', student_id='2024-0001'):
+    """Create a student user with a complete profile."""
+    user = User.objects.create_user(
+        email, 'pw12345678', first_name='Juan', last_name='Cruz', role='student'
+    )
+    return StudentProfile.objects.create(
+        user=user,
+        student_id=student_id,
+        program='CS',
+        year_level='1',
+        sex='M',
+        date_of_birth=date(2004, 1, 1),
+        contact_number='09171234567',
+        address='Quezon City',
+        emergency_contact_name='Maria Cruz',
+        emergency_contact_relationship='Mother',
+        emergency_contact_number='09171234567'
+    )
+
+
+def build_appointment(student, **fields):
+    """Build an unsaved pending appointment."""
+    values = {
+        'student': student,
+        'service_type': 'medical_consultation',
+        'preferred_date': date(2025, 3, 10),
+        'preferred_time_slot': 'morning',
+        'reason': 'Recurring headaches',
+        'emergency_contact_name': 'Maria Cruz',
+        'emergency_contact_number': '09171234567',
+    }
+    values.update(fields)
+    return Appointment(**values)
+
+
+class TicketNumberTests(TestCase):
+    """Ticket numbers are retried on collision and nothing else."""
+    
+    def setUp(self):
+        self.student = create_student()
+    
+    def test_taken_ticket_number_is_retried(self):
+        build_appointment(self.student, ticket_number='APT-2025-AAAAAA').save()
+        
+        with mock.patch.object(
+            Appointment, 'generate_ticket_number',
+            side_effect=['APT-2025-AAAAAA', 'APT-2025-BBBBBB']
+        ):
+            appointment = build_appointment(self.student)
+            appointment.save()
+        
+        self.assertEqual(appointment.ticket_number, 'APT-2025-BBBBBB')
+    
+    def test_other_integrity_errors_are_raised_immediately(self):
+        appointment = build_appointment(self.student, reason=None)
+        
+        with mock.patch.object(
+            Appointment, 'generate_ticket_number', return_value='APT-2025-CCCCCC'
+        ) as generate:
+            with self.assertRaises(IntegrityError):
+                appointment.save()
+        
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(appointment.ticket_number, '')
+
+
+class ApproveTests(TestCase):
+    """approve() only acts on appointments that are still pending."""
+    
+    def setUp(self):
+        self.student = create_student()
+        self.doctor = User.objects.create_user(
+            'doctor@tip.edu.ph', 'pw12345678',
+            first_name='Jose', last_name='Santos', role='doctor'
+        )
+        self.appointment = build_appointment(self.student)
+        self.appointment.save()
+    
+    def test_pending_appointment_is_approved(self):
+        self.assertTrue(self.appointment.approve(self.doctor, doctor=self.doctor))
+        
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.status, 'approved')
+        self.assertEqual(self.appointment.approved_by, self.doctor)
+        self.assertEqual(self.appointment.doctor, self.doctor)
+    
+    def test_stale_copy_does_not_approve_again(self):
+        stale = Appointment.objects.get(pk=self.appointment.pk)
+        Appointment.objects.filter(pk=self.appointment.pk).update(status='cancelled')
+        
+        self.assertFalse(stale.approve(self.doctor, doctor_notes='Come early'))
+        
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.status, 'cancelled')
+        self.assertIsNone(self.appointment.approved_by)
+        self.assertIsNone(self.appointment.doctor_notes)
@@ -7,9 +7,21 @@ import os
 import sys
 import django
 import json
+import multiprocessing
+from functools import lru_cache
+from pathlib import Path
 from django.urls import get_resolver
 from django.conf import settings
 
+# orjson is optional; it serializes the dump in C when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Below this many URL patterns, starting worker processes costs more than it saves
+PARALLEL_THRESHOLD = 200
+
 def setup_django():
     """Initialize Django settings"""
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
@@ -32,6 +44,26 @@ def get_view_name(view_func):
         return view_func.__class__.__name__
     return str(view_func)
 
+@lru_cache(maxsize=None)
+def module_info(view_module):
+    """Derive app name and flags from a view module path (same module recurs across URLs)"""
+    # Detect app name from module path
+    detected_app = 'core'
+    if '.' in view_module:
+        parts = view_module.split('.')
+        if 'views' in parts:
+            idx = parts.index('views')
+            if idx > 0:
+                detected_app = parts[idx - 1]
+        elif len(parts) > 0:
+            detected_app = parts[0]
+    
+    module_lower = view_module.lower()
+    requires_auth = 'login' in module_lower or 'auth' in module_lower
+    is_admin_module = 'admin' in view_module
+    is_api_module = 'rest_framework' in view_module
+    return detected_app, requires_auth, is_admin_module, is_api_module
+
 def extract_urls(urlpatterns=None, prefix='', namespace='', app_name=''):
     """Recursively extract all URL patterns"""
     if urlpatterns is None:
@@ -65,17 +97,7 @@ def extract_urls(urlpatterns=None, prefix='', namespace='', app_name=''):
             callback = pattern.callback
             view_class = get_view_name(callback)
             view_module = callback.__module__ if hasattr(callback, '__module__') else 'unknown'
-            
-            # Detect app name from module path
-            detected_app = 'core'
-            if '.' in view_module:
-                parts = view_module.split('.')
-                if 'views' in parts:
-                    idx = parts.index('views')
-                    if idx > 0:
-                        detected_app = parts[idx - 1]
-                elif len(parts) > 0:
-                    detected_app = parts[0]
+            detected_app, requires_auth, is_admin_module, is_api_module = module_info(view_module)
             
             # Detect HTTP methods (for viewsets/APIView)
             methods = ['GET']  # Default
@@ -88,10 +110,8 @@ def extract_urls(urlpatterns=None, prefix='', namespace='', app_name=''):
                     # It's likely a ViewSet
                     methods = ['GET', 'POST', 'PUT', 'DELETE']
             
-            # Detect authentication requirement
-            requires_auth = 'login' in view_module.lower() or 'auth' in view_module.lower()
-            is_admin = 'admin' in full_path or 'admin' in view_module
-            is_api = 'api' in full_path or 'rest_framework' in view_module
+            is_admin = 'admin' in full_path or is_admin_module
+            is_api = 'api' in full_path or is_api_module
             
             urls_data.append({
                 'path': full_path,
@@ -108,6 +128,36 @@ def extract_urls(urlpatterns=None, prefix='', namespace='', app_name=''):
     
     return urls_data
 
+def count_patterns(urlpatterns):
+    """Count leaf URL patterns, descending into includes"""
+    return sum(
+        count_patterns(pattern.url_patterns) if hasattr(pattern, 'url_patterns') else 1
+        for pattern in urlpatterns
+    )
+
+def extract_top_level(index):
+    """Extract the top-level pattern at index (worker process entry point)"""
+    return extract_urls([get_resolver().url_patterns[index]])
+
+def extract_all_urls():
+    """Extract all URL patterns, splitting top-level includes across processes for large projects"""
+    urlpatterns = get_resolver().url_patterns
+    if count_patterns(urlpatterns) <= PARALLEL_THRESHOLD:
+        return extract_urls(urlpatterns)
+    
+    # Each top-level entry is independent; workers rebuild the resolver themselves
+    with multiprocessing.Pool(initializer=django.setup) as pool:
+        chunks = pool.map(extract_top_level, range(len(urlpatterns)))
+    return [url for chunk in chunks for url in chunk]
+
+def dump_json(data, output_file):
+    """Write data as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
 def main():
     print("🔍 Extracting URLs from Django project...\n")
     
@@ -118,7 +168,7 @@ def main():
     
     # Extract URLs
     try:
-        urls = extract_urls()
+        urls = extract_all_urls()
         print(f"✅ Found {len(urls)} URL patterns\n")
         
         # Group by app for preview
@@ -135,8 +185,7 @@ def main():
         
         # Save to JSON
         output_file = 'urls_dump.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(urls, f, indent=2, ensure_ascii=False)
+        dump_json(urls, output_file)
         
         print(f"\n✅ Saved to: {output_file}")
         print(f"📦 Total URLs extracted: {len(urls)}")
@@ -1,3 +1,130 @@
+import csv
+import io
+import zipfile
+from datetime import date
+
 from django.test import TestCase
+from django.urls import reverse
+
+from accounts.models import User
+from appointments.models import Appointment
+from students.models import MedicalRecord, StudentProfile
+
+
+def create_student(email='student@tip.edu.ph', student_id='2024-0001'):
+    """Create a student user with a complete profile."""
+    user = User.objects.create_user(
+        email, 'pw12345678', first_name='Juan', last_name='Cruz', role='student'
+    )
+    return StudentProfile.objects.create(
+        user=user,
+        student_id=student_id,
+        program='CS',
+        year_level='1',
+        sex='M',
+        date_of_birth=date(2004, 1, 1),
+        contact_number='09171234567',
+        address='Quezon City',
+        emergency_contact_name='Maria Cruz',
+        emergency_contact_relationship='Mother',
+        emergency_contact_number='09171234567'
+    )
+
+
+class DoctorTestCase(TestCase):
+    """Signs in a doctor and provides a student to act on."""
+    
+    def setUp(self):
+        self.doctor = User.objects.create_user(
+            'doctor@tip.edu.ph', 'pw12345678',
+            first_name='Jose', last_name='Santos', role='doctor'
+        )
+        self.client.force_login(self.doctor)
+        self.student = create_student()
+
+
+class ReportExportTests(DoctorTestCase):
+    """The analytics report form exports CSV and Excel files."""
+    
+    def setUp(self):
+        super().setUp()
+        for diagnosis in ['Migraine', 'Migraine', 'Gastritis']:
+            MedicalRecord.objects.create(
+                student=self.student,
+                record_type='medical',
+                visit_date=date(2025, 3, 10),
+                chief_complaint='Pain',
+                diagnosis=diagnosis,
+                status='approved'
+            )
+    
+    def export(self, report_type, format_type):
+        return self.client.get(reverse('doctors:export_report'), {
+            'type': report_type,
+            'format': format_type,
+            'date_from': '2025-03-01',
+            'date_to': '2025-03-31',
+        })
+    
+    def test_morbidity_csv(self):
+        response = self.export('morbidity', 'csv')
+        
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(response.content.decode())))
+        self.assertEqual(rows[0], ['Rank', 'Diagnosis', 'Cases', 'Percentage'])
+        self.assertEqual(rows[1], ['1', 'Migraine', '2', '66.67%'])
+        self.assertEqual(rows[2], ['2', 'Gastritis', '1', '33.33%'])
+    
+    def test_consultation_csv(self):
+        response = self.export('consultation', 'csv')
+        
+        rows = list(csv.reader(io.StringIO(response.content.decode())))
+        self.assertIn(['Medical Consultations', '3'], rows)
+    
+    def test_morbidity_xlsx(self):
+        response = self.export('morbidity', 'excel')
+        
+        self.assertIn('morbidity_report_medical_2025-03-01_2025-03-31.xlsx', response['Content-Disposition'])
+        with zipfile.ZipFile(io.BytesIO(response.content)) as workbook:
+            self.assertIn('xl/worksheets/sheet1.xml', workbook.namelist())
+            shared_strings = workbook.read('xl/sharedStrings.xml').decode()
+        self.assertIn('Migraine', shared_strings)
+        self.assertIn('Gastritis', shared_strings)
+    
+    def test_consultation_xlsx(self):
+        response = self.export('consultation', 'excel')
+        
+        self.assertIn('consultation_report_2025-03-01_2025-03-31.xlsx', response['Content-Disposition'])
+        with zipfile.ZipFile(io.BytesIO(response.content)) as workbook:
+            shared_strings = workbook.read('xl/sharedStrings.xml').decode()
+        self.assertIn('Medical Consultations', shared_strings)
+
 
-# Create your tests here.
+class ApproveAppointmentViewTests(DoctorTestCase):
+    """Approving an appointment that is no longer pending changes nothing."""
+    
+    def setUp(self):
+        super().setUp()
+        self.appointment = Appointment.objects.create(
+            student=self.student,
+            service_type='medical_consultation',
+            preferred_date=date(2025, 3, 10),
+            preferred_time_slot='morning',
+            reason='Recurring headaches',
+            emergency_contact_name='Maria Cruz',
+            emergency_contact_number='09171234567',
+            status='cancelled'
+        )
+    
+    def test_cancelled_appointment_is_not_approved(self):
+        response = self.client.post(
+            reverse('doctors:approve_appointment', args=[self.appointment.pk]),
+            {'doctor_notes': 'Come early'}
+        )
+        
+        self.assertRedirects(
+            response, reverse('doctors:appointments'), fetch_redirect_response=False
+        )
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.status, 'cancelled')
+        self.assertIsNone(self.appointment.approved_by)
@@ -40,6 +40,7 @@ urlpatterns = [
     # Analytics & Reports
     path('analytics/', views.analytics_dashboard, name='analytics'),
     path('reports/export/', views.export_report, name='export_report'),
+    path('reports/<uuid:report_id>/status/', views.report_status, name='report_status'),
     
     # Settings
     path('settings/', views.settings_view, name='settings'),
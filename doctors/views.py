@@ -2,11 +2,15 @@
 Views for doctor/admin portal.
 """
 
+import logging
+import os
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.db.models import Count, Q
-from django.http import HttpResponse, JsonResponse
+from django.http import FileResponse, HttpResponse, JsonResponse
+from django.urls import reverse
 from django.utils import timezone
 from accounts.decorators import doctor_required
 from accounts.forms import DoctorProfileForm
@@ -27,9 +31,13 @@ from analytics.services import (
 from analytics.exports import (
     export_morbidity_report_csv,
     export_morbidity_report_pdf,
+    export_morbidity_report_xlsx,
     export_consultation_report_csv,
-    export_consultation_report_pdf
+    export_consultation_report_pdf,
+    export_consultation_report_xlsx
 )
+from analytics.models import GeneratedReport
+from analytics.reports import enqueue_report_pdf
 from notifications.services import (
     notify_appointment_approved,
     notify_request_approved,
@@ -37,6 +45,8 @@ from notifications.services import (
     notify_certificate_issued
 )
 
+logger = logging.getLogger(__name__)
+
 
 @login_required
 @doctor_required
@@ -212,9 +222,7 @@ def manage_appointments(request):
     
     # Filter logic
     form = AppointmentSearchForm(request.GET or None)
-    appointments = Appointment.objects.select_related(
-        'student__user', 'doctor'
-    ).order_by('-preferred_date', '-created_at')
+    appointments = Appointment.list_objects.order_by('-preferred_date', '-created_at')
     
     if form.is_valid():
         if form.cleaned_data.get('search_query'):
@@ -265,11 +273,15 @@ def approve_appointment(request, appointment_id):
         form = AppointmentApprovalForm(request.POST, instance=appointment)
         if form.is_valid():
             appointment = form.save(commit=False)
-            appointment.approve(
+            approved = appointment.approve(
                 approved_by_user=request.user,
                 doctor=form.cleaned_data.get('doctor'),
-                actual_datetime=form.cleaned_data.get('actual_datetime')
+                actual_datetime=form.cleaned_data.get('actual_datetime'),
+                doctor_notes=form.cleaned_data.get('doctor_notes')
             )
+            if not approved:
+                messages.error(request, 'This appointment is no longer pending approval.')
+                return redirect('doctors:appointments')
             
             # Send notification
             notify_appointment_approved(appointment)
@@ -370,21 +382,62 @@ def analytics_dashboard(request):
     return render(request, 'doctor/doctor-analytics.html', context)
 
 
+def queue_pdf_report(request, report_type, report_name, date_from, date_to, filters=None):
+    """
+    Create a pending GeneratedReport, render it in the background and
+    answer 202 with the URL to poll for the file.
+    """
+    report = GeneratedReport.objects.create(
+        report_type=report_type,
+        report_name=report_name,
+        format='pdf',
+        date_from=date_from,
+        date_to=date_to,
+        filters_applied=filters or {},
+        generated_by=request.user,
+        status='pending',
+    )
+    enqueue_report_pdf(report.pk)
+    
+    return JsonResponse({
+        'id': str(report.pk),
+        'status': report.status,
+        'status_url': reverse('doctors:report_status', args=[report.pk]),
+    }, status=202)
+
+
 @login_required
 @doctor_required
 def export_report(request):
-    """Export reports to CSV or PDF."""
+    """
+    Export reports to CSV or PDF.
+    PDFs are rendered in the background when the client asks for JSON.
+    """
     
     report_type = request.GET.get('type')
     format_type = request.GET.get('format', 'pdf')
     date_from = request.GET.get('date_from', timezone.now().date() - timezone.timedelta(days=30))
     date_to = request.GET.get('date_to', timezone.now().date())
+    queue_pdf = format_type == 'pdf' and 'application/json' in request.headers.get('Accept', '')
+    
+    if queue_pdf and report_type == 'morbidity':
+        return queue_pdf_report(
+            request, 'morbidity', 'Top Morbidities Report - Medical',
+            date_from, date_to, {'record_type': 'medical'}
+        )
+    
+    if queue_pdf and report_type == 'consultation':
+        return queue_pdf_report(
+            request, 'consultation', 'Consultation Statistics Report', date_from, date_to
+        )
     
     if report_type == 'morbidity':
         morbidities = get_top_morbidities('medical', limit=10, date_from=date_from, date_to=date_to)
         
         if format_type == 'csv':
             return export_morbidity_report_csv(morbidities, date_from, date_to)
+        elif format_type == 'excel':
+            return export_morbidity_report_xlsx(morbidities, date_from, date_to, 'medical')
         else:
             return export_morbidity_report_pdf(morbidities, date_from, date_to, 'medical')
     
@@ -393,6 +446,8 @@ def export_report(request):
         
         if format_type == 'csv':
             return export_consultation_report_csv(stats, date_from, date_to)
+        elif format_type == 'excel':
+            return export_consultation_report_xlsx(stats, date_from, date_to)
         else:
             return export_consultation_report_pdf(stats, date_from, date_to)
     
@@ -400,6 +455,37 @@ def export_report(request):
     return redirect('doctors:analytics')
 
 
+@login_required
+@doctor_required
+def report_status(request, report_id):
+    """Poll a queued report; ?download=1 returns the file once it is ready."""
+    
+    report = get_object_or_404(GeneratedReport, pk=report_id, generated_by=request.user)
+    
+    if report.status == 'ready' and request.GET.get('download'):
+        report.increment_download()
+        filename = os.path.basename(report.report_file.name)
+        
+        # Let nginx send the file itself when it fronts the media directory
+        if settings.REPORT_DOWNLOAD_ACCEL_REDIRECT:
+            response = HttpResponse(content_type='application/pdf')
+            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            response['X-Accel-Redirect'] = report.report_file.url
+            return response
+        
+        return FileResponse(report.report_file.open('rb'), as_attachment=True, filename=filename)
+    
+    download_url = None
+    if report.status == 'ready':
+        download_url = f"{reverse('doctors:report_status', args=[report.pk])}?download=1"
+    
+    return JsonResponse({
+        'id': str(report.pk),
+        'status': report.status,
+        'download_url': download_url,
+    })
+
+
 @login_required
 @doctor_required
 def settings_view(request):
@@ -480,7 +566,11 @@ def settings_view(request):
     # Get all users for admin
     users = []
     if request.user.is_admin_user():
-        users = User.objects.all().order_by('-date_joined')
+        # Only the columns the user table renders
+        users = User.objects.only(
+            'id', 'email', 'full_name', 'first_name', 'last_name',
+            'role', 'is_active', 'date_joined'
+        ).order_by('-date_joined')
     
     # Check if user needs to complete profile (first login)
     show_profile_completion_alert = False
@@ -504,7 +594,7 @@ def appointment_detail(request, appointment_id):
     """View appointment details (doctor view)."""
     
     appointment = get_object_or_404(
-        Appointment.objects.select_related('student__user', 'doctor'),
+        Appointment.list_objects,
         id=appointment_id
     )
     
@@ -554,7 +644,7 @@ def appointment_detail(request, appointment_id):
     """View appointment details (doctor view)."""
     
     appointment = get_object_or_404(
-        Appointment.objects.select_related('student__user', 'doctor'),
+        Appointment.list_objects,
         id=appointment_id
     )
     
@@ -679,7 +769,7 @@ def generate_prescription(request):
             messages.error(request, f'No student found with ID: {student_id}')
         except Exception as e:
             messages.error(request, f'Error generating prescription: {str(e)}')
-            print(f"ERROR: {str(e)}")
+            logger.exception('Error generating prescription')
     
     return render(request, 'doctor/generate-prescription.html')
 
@@ -745,9 +835,7 @@ def generate_clearance(request):
             messages.error(request, f'No student found with ID: {student_id}')
         except Exception as e:
             messages.error(request, f'Error generating clearance: {str(e)}')
-            print(f"ERROR: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error generating clearance')
     
     return render(request, 'doctor/generate-clearance.html')
 
@@ -813,9 +901,7 @@ def generate_certificate(request):
             messages.error(request, f'No student found with ID: {student_id}')
         except Exception as e:
             messages.error(request, f'Error generating certificate: {str(e)}')
-            print(f"ERROR: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error generating certificate')
     
     return render(request, 'doctor/generate-certificate.html')
 
@@ -882,9 +968,7 @@ def generate_dental_certificate(request):
             messages.error(request, f'No student found with ID: {student_id}')
         except Exception as e:
             messages.error(request, f'Error generating dental certificate: {str(e)}')
-            print(f"ERROR: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception('Error generating dental certificate')
     
     return render(request, 'doctor/generate-dental-certificate.html')
 
@@ -5,11 +5,26 @@ Handles in-app and email notifications.
 
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
 import uuid
 
 
+# Unread counts are cached briefly per user for the template context processor
+UNREAD_COUNT_CACHE_TIMEOUT = 30
+
+
+def unread_count_cache_key(user_id):
+    """Return the cache key holding a user's unread notification count."""
+    return f'unread_notifications_count:{user_id}'
+
+
+def invalidate_unread_count(user_id):
+    """Drop the cached unread notification count for a user."""
+    cache.delete(unread_count_cache_key(user_id))
+
+
 class Notification(models.Model):
     """
     In-app notifications for users.
@@ -143,7 +158,11 @@ class Notification(models.Model):
         verbose_name_plural = _('notifications')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['recipient', 'is_read']),
+            # Serves the unread filter and its newest-first ordering
+            models.Index(
+                fields=['recipient', 'is_read', '-created_at'],
+                name='notif_unread_recent_idx'
+            ),
             models.Index(fields=['notification_type']),
             models.Index(fields=['created_at']),
             models.Index(fields=['priority']),
@@ -152,6 +171,18 @@ class Notification(models.Model):
     def __str__(self):
         return f"{self.title} - {self.recipient.email}"
     
+    def save(self, *args, **kwargs):
+        """Save notification and invalidate the recipient's cached unread count."""
+        super().save(*args, **kwargs)
+        invalidate_unread_count(self.recipient_id)
+    
+    def delete(self, *args, **kwargs):
+        """Delete notification and invalidate the recipient's cached unread count."""
+        recipient_id = self.recipient_id
+        result = super().delete(*args, **kwargs)
+        invalidate_unread_count(recipient_id)
+        return result
+    
     def mark_as_read(self):
         """Mark notification as read."""
         if not self.is_read:
@@ -7,7 +7,7 @@ from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils import timezone
 from datetime import timedelta
-from .models import Notification, EmailLog, NotificationPreference
+from .models import Notification, EmailLog, NotificationPreference, invalidate_unread_count
 
 
 def create_notification(
@@ -342,13 +342,17 @@ def mark_expired_notifications():
     Returns:
         Number of notifications marked as read
     """
+    now = timezone.now()
     expired = Notification.objects.filter(
-        expires_at__lt=timezone.now(),
+        expires_at__lt=now,
         is_read=False
     )
+    recipient_ids = set(expired.values_list('recipient_id', flat=True))
+    count = expired.update(is_read=True, read_at=now)
     
-    count = expired.count()
-    expired.update(is_read=True, read_at=timezone.now())
+    # update() skips Notification.save(), so drop the cached counts here
+    for recipient_id in recipient_ids:
+        invalidate_unread_count(recipient_id)
     
     return count
 
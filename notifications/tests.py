@@ -1,3 +1,40 @@
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import User
+from .models import Notification, unread_count_cache_key
+from .services import mark_expired_notifications
+
 
-# Create your tests here.
+class MarkExpiredNotificationsTests(TestCase):
+    """Expiring notifications also drops the recipients' cached unread counts."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(
+            'student@tip.edu.ph', 'pw12345678', role='student'
+        )
+        self.notification = Notification.objects.create(
+            recipient=self.user,
+            title='Appointment reminder',
+            message='Your appointment is tomorrow.',
+            expires_at=timezone.now() - timedelta(days=1)
+        )
+        cache.set(unread_count_cache_key(self.user.pk), 1)
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def test_expired_notifications_are_marked_read(self):
+        self.assertEqual(mark_expired_notifications(), 1)
+        
+        self.notification.refresh_from_db()
+        self.assertTrue(self.notification.is_read)
+        self.assertIsNotNone(self.notification.read_at)
+    
+    def test_cached_unread_count_is_invalidated(self):
+        mark_expired_notifications()
+        
+        self.assertIsNone(cache.get(unread_count_cache_key(self.user.pk)))
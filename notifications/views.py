@@ -6,7 +6,7 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
 from django.db.models import Q
-from .models import Notification, NotificationPreference
+from .models import Notification, NotificationPreference, invalidate_unread_count
 
 
 @login_required
@@ -55,6 +55,7 @@ def mark_all_read(request):
         recipient=request.user,
         is_read=False
     ).update(is_read=True)
+    invalidate_unread_count(request.user.pk)
     
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         return JsonResponse({'success': True})
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='medicalrecord',
+            name='students_me_status_829130_idx',
+        ),
+        migrations.AddIndex(
+            model_name='medicalrecord',
+            index=models.Index(fields=['status', 'visit_date', 'record_type'], name='medrec_status_date_type_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0002_medicalrecord_status_date_type_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='medicalrecord',
+            index=models.Index(fields=['status', 'record_type', 'visit_date'], name='mr_status_type_date'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0003_mr_status_type_date'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='medicalrecord',
+            name='medrec_status_date_type_idx',
+        ),
+    ]
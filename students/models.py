@@ -406,7 +406,9 @@ class MedicalRecord(models.Model):
         ordering = ['-visit_date', '-created_at']
         indexes = [
             models.Index(fields=['student', 'record_type']),
-            models.Index(fields=['status', 'visit_date']),
+            # Per-type lookups (top morbidities) filter on record_type before the
+            # date range; the approved-records-in-range counts are covered too
+            models.Index(fields=['status', 'record_type', 'visit_date'], name='mr_status_type_date'),
             models.Index(fields=['created_at']),
         ]
     
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('templates_docs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='prescription',
+            index=models.Index(fields=['date_issued'], name='prescription_issued_idx'),
+        ),
+    ]
@@ -396,6 +396,7 @@ class Prescription(models.Model):
         indexes = [
             models.Index(fields=['prescription_number']),
             models.Index(fields=['student', 'date_issued']),
+            models.Index(fields=['date_issued'], name='prescription_issued_idx'),
         ]
     
     def __str__(self):
@@ -57,6 +57,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.middleware.AccountsContextMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -90,6 +91,16 @@ DATABASES = {
     'default': env.db('DATABASE_URL', default='sqlite:///db.sqlite3')
 }
 
+# Cache
+# Cached analytics, unread counts and email checks are invalidated on write,
+# which only reaches other workers through a shared backend. Local memory is
+# per-process and only suitable for a single development server; production
+# should set e.g. CACHE_URL=dbcache://django_cache (then run createcachetable)
+# or CACHE_URL=rediscache://127.0.0.1:6379/1.
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://')
+}
+
 # Custom User Model - MUST BE SET BEFORE FIRST MIGRATION
 AUTH_USER_MODEL = 'accounts.User'
 
@@ -99,6 +110,16 @@ AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
 ]
 
+# Password hashing - Argon2id first; PBKDF2 kept to verify older hashes
+PASSWORD_HASHERS = [
+    'accounts.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+ARGON2_TIME_COST = env.int('ARGON2_TIME_COST', default=1)
+ARGON2_MEMORY_COST = env.int('ARGON2_MEMORY_COST', default=47104)  # KiB
+ARGON2_PARALLELISM = env.int('ARGON2_PARALLELISM', default=1)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -123,6 +144,9 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 MEDIA_URL = env('MEDIA_URL', default='/media/')
 MEDIA_ROOT = BASE_DIR / env('MEDIA_ROOT', default='media')
 
+# Serve generated report downloads through nginx X-Accel-Redirect
+REPORT_DOWNLOAD_ACCEL_REDIRECT = env.bool('REPORT_DOWNLOAD_ACCEL_REDIRECT', default=False)
+
 # Default primary key
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 